@@ -0,0 +1,32 @@
+"""add audit log keyset index
+
+Revision ID: 3f6c2a9d1e47
+Revises: 8389b01af5b6
+Create Date: 2026-10-16 09:12:05.418230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f6c2a9d1e47'
+down_revision: Union[str, None] = '8389b01af5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite index for cursor-based pagination of /admin/audit-log
+    op.create_index(
+        'ix_admin_audit_log_timestamp_id',
+        'admin_audit_log',
+        [sa.text('timestamp DESC'), sa.text('id DESC')],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_admin_audit_log_timestamp_id', table_name='admin_audit_log')
@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from brokerage_parser.config import settings
 from brokerage_parser.db import get_db
 from brokerage_parser.models.admin import AdminUser
-from brokerage_parser.core.security import verify_password
+from brokerage_parser.core.security import verify_password_async
 
 router = APIRouter(prefix="/admin/auth", tags=["Admin Auth"])
 
@@ -87,7 +87,7 @@ def get_current_admin(token: str = Depends(oauth2_scheme), db: Session = Depends
 @router.post("/token", response_model=Token)
 async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     user = db.query(AdminUser).filter(AdminUser.email == form_data.username).first()
-    if not user or not verify_password(form_data.password, user.password_hash):
+    if not user or not await verify_password_async(form_data.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -10,7 +10,7 @@ from sqlalchemy import func, text
 from brokerage_parser.config import settings
 from brokerage_parser.db import get_db
 from brokerage_parser.models.tenant import ApiKey, Tenant, Organization
-from brokerage_parser.core.security import verify_password
+from brokerage_parser.core.security import verify_api_key_secret_async
 
 router = APIRouter(prefix="/portal/auth", tags=["Portal Auth"])
 
@@ -93,7 +93,7 @@ async def portal_login(login_request: PortalLoginRequest, db: Session = Depends(
 
 
     # 2. Verify Secret
-    if not verify_password(login_request.secret_key, api_key.secret_hash):
+    if not await verify_api_key_secret_async(login_request.secret_key, api_key.secret_hash):
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
     # 3. Check Active Status
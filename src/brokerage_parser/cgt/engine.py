@@ -2,6 +2,8 @@ from typing import List, Dict, Optional
 from decimal import Decimal
 from datetime import timedelta
 from dataclasses import dataclass
+from collections import deque
+from itertools import groupby
 import copy
 
 from brokerage_parser.models import TransactionType, TaxWrapper, CorporateActionType
@@ -9,6 +11,9 @@ from brokerage_parser.models.domain import Transaction, CorporateAction
 from brokerage_parser.cgt.models import MatchEvent, MatchType, CGTReport
 from brokerage_parser.cgt.pool import Section104Pool
 
+# Shared constant; Decimal is immutable so one instance serves every event
+_ZERO = Decimal("0.00")
+
 @dataclass
 class MutableTransaction:
     """
@@ -36,6 +41,13 @@ class MutableTransaction:
             return abs(self.original.gbp_amount)
         return abs(self.original.amount)
 
+    def pro_rata(self, quantity: Decimal) -> Decimal:
+        """
+        Portion of the total proceeds/cost attributable to `quantity`.
+        Multiply first, divide once: avoids rounding an intermediate ratio.
+        """
+        return self.total_proceeds_or_cost * quantity / self.original.quantity
+
 class CGTEngine:
     """
     Calculates Capital Gains according to UK HMRC Share Matching Rules:
@@ -96,79 +108,53 @@ class CGTEngine:
         # Split into Buys and Sells for easier indexing, but keep reference to main list
         # Actually, iterating the main list is safer to keep logic clean.
 
-        # PASS 1: SAME DAY
-        self._pass_same_day(mutable_txs, report)
-
-        # PASS 2: BED AND BREAKFAST (30 Days)
-        self._pass_bed_and_breakfast(mutable_txs, report)
+        # PASS 1+2: SAME DAY, then BED AND BREAKFAST (30 Days), in one chronological sweep
+        self._pass_same_day_and_bnb(mutable_txs, report)
 
         # PASS 3: SECTION 104 POOL
         self._pass_section_104(mutable_txs, corporate_actions, report)
 
-    def _pass_same_day(self, txs: List[MutableTransaction], report: CGTReport):
+    def _pass_same_day_and_bnb(self, txs: List[MutableTransaction], report: CGTReport):
         """
-        Match Sells to Buys occurring on the EXACT SAME date.
+        Single forward sweep over the date-sorted transactions.
+        On each date, Sells are first matched to Buys on that EXACT SAME date.
+        Buys left over after that settle earlier Sells whose 30-day window is
+        still open (Bed & Breakfast), earliest Sell first.
+        Sells with quantity left after their own day wait in `pending_sells`
+        until their window closes.
         """
-        # Group by date
-        by_date = {}
-        for tx in txs:
-            if tx.remaining_quantity > 0:
-                d = tx.date
-                if d not in by_date: by_date[d] = []
-                by_date[d].append(tx)
+        pending_sells = deque()
 
-        for d, day_txs in by_date.items():
-            buys = [t for t in day_txs if t.original.type == TransactionType.BUY]
-            sells = [t for t in day_txs if t.original.type == TransactionType.SELL]
+        for d, day_txs in groupby(txs, key=lambda t: t.date):
+            day_txs = list(day_txs)
+            buys = [t for t in day_txs if t.original.type == TransactionType.BUY and t.remaining_quantity > 0]
+            sells = [t for t in day_txs if t.original.type == TransactionType.SELL and t.remaining_quantity > 0]
 
-            # Match efficiently
-            # We iterate sells and try to fill from buys
+            # 1. Same Day
             for sell in sells:
-                if sell.remaining_quantity <= 0: continue
-
                 for buy in buys:
-                    if buy.remaining_quantity <= 0: continue
                     if sell.remaining_quantity <= 0: break
+                    if buy.remaining_quantity <= 0: continue
 
                     self._execute_match(sell, buy, MatchType.SAME_DAY, report)
 
-    def _pass_bed_and_breakfast(self, txs: List[MutableTransaction], report: CGTReport):
-        """
-        Match Sells to Buys occurring within the NEXT 30 days.
-        """
-        # We need to iterate Sells chronologically
-        # For each Sell, look ahead in the list for Buys in window
-
-        # Ensure we are sorted strictly
-        txs.sort(key=lambda t: t.date)
-
-        for i, sell in enumerate(txs):
-            if sell.original.type != TransactionType.SELL: continue
-            if sell.remaining_quantity <= 0: continue
-
-            sell_date = sell.date
-            window_end = sell_date + timedelta(days=30)
+            # 2. Bed & Breakfast
+            # HMRC: "acquired within the 30 days following the day of disposal"
+            # Drop sells whose window closed before today (or that are already fully matched)
+            while pending_sells and (
+                pending_sells[0].remaining_quantity <= 0
+                or pending_sells[0].date + timedelta(days=30) < d
+            ):
+                pending_sells.popleft()
 
-            # Look ahead
-            for j in range(i + 1, len(txs)):
-                buy = txs[j]
-                if buy.original.type != TransactionType.BUY: continue
-                if buy.remaining_quantity <= 0: continue
-
-                # Check 30 day window
-                # Start date is strictly > sell date (same day handled above)
-                # HMRC: "acquired within the 30 days following the day of disposal"
-                if buy.date <= sell_date: continue # Should be filtered by i+1 but double check sorting stability
-                if buy.date > window_end:
-                    # Optimization: Since sorted by date, if we pass window we can stop looking for this sell?
-                    # Yes, provided list is sorted by date.
-                    break
+            for sell in pending_sells:
+                for buy in buys:
+                    if sell.remaining_quantity <= 0: break
+                    if buy.remaining_quantity <= 0: continue
 
-                # We have a match candidate
-                self._execute_match(sell, buy, MatchType.BED_AND_BREAKFAST, report)
+                    self._execute_match(sell, buy, MatchType.BED_AND_BREAKFAST, report)
 
-                if sell.remaining_quantity <= 0:
-                    break
+            pending_sells.extend(s for s in sells if s.remaining_quantity > 0)
 
     def _pass_section_104(self, txs: List[MutableTransaction], corporate_actions: List[CorporateAction], report: CGTReport):
         """
@@ -213,9 +199,9 @@ class CGTEngine:
                             buy_transaction_id=None,
                             match_type=MatchType.CORPORATE_ACTION,
                             quantity=new_qty - old_qty, # Change in quantity
-                            proceeds=Decimal("0.00"),
-                            allowable_cost=Decimal("0.00"),
-                            gain_gbp=Decimal("0.00"),
+                            proceeds=_ZERO,
+                            allowable_cost=_ZERO,
+                            gain_gbp=_ZERO,
                             date=action.date.isoformat()
                         )
                         report.add_event(event)
@@ -228,8 +214,7 @@ class CGTEngine:
                     # Add to pool
                     # Calculate cost proportionate to the remaining quantity!
                     # If we used half the buy for a Same Day match, we only add half the cost here.
-                    ratio = tx.remaining_quantity / tx.original.quantity
-                    cost_to_add = tx.total_proceeds_or_cost * ratio
+                    cost_to_add = tx.pro_rata(tx.remaining_quantity)
 
                     pool.add(tx.remaining_quantity, cost_to_add)
 
@@ -241,8 +226,7 @@ class CGTEngine:
                     qty_to_process = tx.remaining_quantity
 
                     # Calculate pro-rated proceeds
-                    ratio = qty_to_process / tx.original.quantity
-                    proceeds = tx.total_proceeds_or_cost * ratio
+                    proceeds = tx.pro_rata(qty_to_process)
 
                     # Remove from pool (gets cost basis)
                     cost_basis = pool.remove(qty_to_process)
@@ -271,13 +255,8 @@ class CGTEngine:
         match_qty = min(sell.remaining_quantity, buy.remaining_quantity)
 
         # Calculate proportional values
-        # Sell Proceeds
-        sell_ratio = match_qty / sell.original.quantity
-        proceeds = sell.total_proceeds_or_cost * sell_ratio
-
-        # Buy Cost
-        buy_ratio = match_qty / buy.original.quantity
-        cost = buy.total_proceeds_or_cost * buy_ratio
+        proceeds = sell.pro_rata(match_qty)
+        cost = buy.pro_rata(match_qty)
 
         gain = proceeds - cost
 
@@ -1,7 +1,10 @@
+import json
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
+
+_ZERO = Decimal("0.00")
 
 class MatchType(Enum):
     SAME_DAY = "SAME_DAY"
@@ -9,7 +12,10 @@ class MatchType(Enum):
     SECTION_104 = "SECTION_104"   # Pool
     CORPORATE_ACTION = "CORPORATE_ACTION" # Stock splits, etc.
 
-@dataclass
+# Plain dict lookup is cheaper than the Enum .value descriptor on every serialized event
+_MATCH_TYPE_VALUES = {m: m.value for m in MatchType}
+
+@dataclass(slots=True)
 class MatchEvent:
     sell_transaction_id: str
     match_type: MatchType
@@ -28,42 +34,110 @@ class MatchEvent:
         return {
             "sell_transaction_id": self.sell_transaction_id,
             "buy_transaction_id": self.buy_transaction_id,
-            "match_type": self.match_type.value,
-            "quantity": str(self.quantity),
-            "proceeds": str(self.proceeds),
-            "allowable_cost": str(self.allowable_cost),
-            "gain_gbp": str(self.gain_gbp),
+            "match_type": _MATCH_TYPE_VALUES[self.match_type],
+            "quantity": format(self.quantity, "f"),
+            "proceeds": format(self.proceeds, "f"),
+            "allowable_cost": format(self.allowable_cost, "f"),
+            "gain_gbp": format(self.gain_gbp, "f"),
             "date": self.date
         }
 
-@dataclass
+    def write_json(self, fp):
+        """Write this event as a compact JSON object; same content as json.dumps(to_dict())."""
+        fp.write(
+            '{"sell_transaction_id":%s,"buy_transaction_id":%s,"match_type":"%s",'
+            '"quantity":"%s","proceeds":"%s","allowable_cost":"%s","gain_gbp":"%s","date":%s}' % (
+                json.dumps(self.sell_transaction_id),
+                json.dumps(self.buy_transaction_id),
+                _MATCH_TYPE_VALUES[self.match_type],
+                format(self.quantity, "f"),
+                format(self.proceeds, "f"),
+                format(self.allowable_cost, "f"),
+                format(self.gain_gbp, "f"),
+                json.dumps(self.date),
+            )
+        )
+
+@dataclass(slots=True)
 class CGTReport:
     tax_year: str
-    total_gains: Decimal = Decimal("0.00")
-    total_losses: Decimal = Decimal("0.00")
-    net_gain: Decimal = Decimal("0.00")
-    total_proceeds: Decimal = Decimal("0.00")
-    total_allowable_costs: Decimal = Decimal("0.00")
     match_events: List[MatchEvent] = field(default_factory=list)
+    # Totals are aggregated lazily in one pass over match_events; None = stale
+    _totals: Optional[Tuple[Decimal, ...]] = field(default=None, init=False, repr=False, compare=False)
 
     def add_event(self, event: MatchEvent):
         self.match_events.append(event)
-        if event.gain_gbp > 0:
-            self.total_gains += event.gain_gbp
-        else:
-            self.total_losses += event.gain_gbp # This will be negative
+        self._totals = None
+
+    def _recompute(self):
+        gains = losses = proceeds = costs = _ZERO
+        for event in self.match_events:
+            gain = event.gain_gbp
+            # Sign-bit checks instead of `> 0`: no comparison against a coerced zero
+            if gain.is_signed() or gain.is_zero():
+                losses += gain # This will be negative
+            else:
+                gains += gain
+            proceeds += event.proceeds
+            costs += event.allowable_cost
+        self._totals = (gains, losses, gains + losses, proceeds, costs)
+
+    def _get_totals(self):
+        if self._totals is None:
+            self._recompute()
+        return self._totals
 
-        self.net_gain += event.gain_gbp
-        self.total_proceeds += event.proceeds
-        self.total_allowable_costs += event.allowable_cost
+    @property
+    def total_gains(self) -> Decimal:
+        return self._get_totals()[0]
+
+    @property
+    def total_losses(self) -> Decimal:
+        return self._get_totals()[1]
+
+    @property
+    def net_gain(self) -> Decimal:
+        return self._get_totals()[2]
+
+    @property
+    def total_proceeds(self) -> Decimal:
+        return self._get_totals()[3]
+
+    @property
+    def total_allowable_costs(self) -> Decimal:
+        return self._get_totals()[4]
 
     def to_dict(self):
+        total_gains, total_losses, net_gain, total_proceeds, total_allowable_costs = self._get_totals()
         return {
             "tax_year": self.tax_year,
-            "total_gains": str(self.total_gains),
-            "total_losses": str(self.total_losses),
-            "net_gain": str(self.net_gain),
-            "total_proceeds": str(self.total_proceeds),
-            "total_allowable_costs": str(self.total_allowable_costs),
+            "total_gains": format(total_gains, "f"),
+            "total_losses": format(total_losses, "f"),
+            "net_gain": format(net_gain, "f"),
+            "total_proceeds": format(total_proceeds, "f"),
+            "total_allowable_costs": format(total_allowable_costs, "f"),
             "match_events": [e.to_dict() for e in self.match_events]
         }
+
+    def write_json(self, fp):
+        """
+        Stream the report to `fp` as compact JSON without building the
+        intermediate to_dict() structure; parses to the same object.
+        """
+        total_gains, total_losses, net_gain, total_proceeds, total_allowable_costs = self._get_totals()
+        fp.write(
+            '{"tax_year":%s,"total_gains":"%s","total_losses":"%s","net_gain":"%s",'
+            '"total_proceeds":"%s","total_allowable_costs":"%s","match_events":[' % (
+                json.dumps(self.tax_year),
+                format(total_gains, "f"),
+                format(total_losses, "f"),
+                format(net_gain, "f"),
+                format(total_proceeds, "f"),
+                format(total_allowable_costs, "f"),
+            )
+        )
+        for i, event in enumerate(self.match_events):
+            if i:
+                fp.write(",")
+            event.write_json(fp)
+        fp.write("]}")
@@ -1,33 +1,82 @@
-from decimal import Decimal
+from decimal import Context, Decimal, ROUND_HALF_EVEN
 from typing import Tuple
 
+# Fixed-point precision of the pool's internal state (decimal places).
+# Quantities are held in 1e-8 share units, costs in 1e-4 GBP units.
+QTY_PLACES = 8
+COST_PLACES = 4
+
+# Shared constant; Decimal is immutable so one instance serves every return
+_ZERO = Decimal("0.00")
+
+# Explicit context for the remaining Decimal ops: skips the thread-local getcontext()
+# lookup and caps the mantissa at 18 digits, enough for 8dp quantities / 4dp costs.
+_CTX = Context(prec=18, rounding=ROUND_HALF_EVEN)
+
+def _to_units(value: Decimal, places: int) -> int:
+    """Decimal -> fixed-point int. Digits beyond `places` round half-even."""
+    return int(value.scaleb(places).to_integral_value(ROUND_HALF_EVEN))
+
+def _div_half_even(numerator: int, denominator: int) -> int:
+    """Integer division (denominator > 0) rounded half-even, so repeated splits don't drift one way."""
+    quotient, remainder = divmod(numerator, denominator)
+    twice = 2 * remainder
+    if twice > denominator or (twice == denominator and quotient % 2):
+        quotient += 1
+    return quotient
+
+def _from_units(units: int, places: int) -> Decimal:
+    """Fixed-point int -> Decimal."""
+    return Decimal(units).scaleb(-places)
+
 class Section104Pool:
     """
     Represents a Section 104 Holding (Pool) for a single security.
     Tracks the total number of shares and total allowable cost.
+
+    State is kept as integer micro-units so add/remove are plain int
+    arithmetic; values are converted to Decimal only at the API boundary.
+
+    Precision contract: quantities are held to 8dp and costs to 4dp (GBP).
+    Inputs with more digits, split results and the cost allocated to a
+    partial disposal are rounded half-even to those places.
     """
     def __init__(self):
-        self.total_quantity = Decimal("0.00")
-        self.total_cost = Decimal("0.00")
+        self._quantity_u = 0
+        self._cost_u = 0
+
+    @property
+    def total_quantity(self) -> Decimal:
+        return _from_units(self._quantity_u, QTY_PLACES)
+
+    @property
+    def total_cost(self) -> Decimal:
+        return _from_units(self._cost_u, COST_PLACES)
 
     def add(self, quantity: Decimal, cost: Decimal):
         """
         Add shares to the pool (Acquisition).
         """
-        if quantity <= 0:
+        if quantity.is_zero() or quantity.is_signed():
             return # Should define behavior for 0 quantity?
 
-        self.total_quantity += quantity
-        self.total_cost += cost
+        self._quantity_u += _to_units(quantity, QTY_PLACES)
+        self._cost_u += _to_units(cost, COST_PLACES)
 
     def adjust_quantity(self, ratio: Decimal) -> Tuple[Decimal, Decimal]:
         """
         Adjust the pool quantity by a ratio (e.g. for Stock Splits).
         Total cost remains unchanged.
         Returns (old_quantity, new_quantity).
+
+        Whole-number ratios (2-for-1, 3-for-1) scale the integer state directly;
+        fractional ratios (reverse splits, 3-for-2) go through a Decimal multiply.
         """
         old_quantity = self.total_quantity
-        self.total_quantity = self.total_quantity * ratio
+        if ratio == ratio.to_integral_value():
+            self._quantity_u *= int(ratio)
+        else:
+            self._quantity_u = _to_units(_CTX.multiply(old_quantity, ratio), QTY_PLACES)
         return old_quantity, self.total_quantity
 
     def remove(self, quantity: Decimal) -> Decimal:
@@ -35,41 +84,43 @@ class Section104Pool:
         Remove shares from the pool (Disposal).
         Returns the allowable cost for the removed quantity based on the average.
         """
-        if quantity <= 0:
-            return Decimal("0.00")
+        if quantity.is_zero() or quantity.is_signed():
+            return _ZERO
 
-        if self.total_quantity == 0:
+        if self._quantity_u == 0:
             # Handling disposal with empty pool (error state effectively, or negative position)
             # In strict CGT calc, you can't sell what you don't have, but shorts might exist.
             # For this engine, we assume long-only or pre-validated data.
             # Returning 0 cost implies 100% gain, which is a safe default for "missing data".
-            return Decimal("0.00")
+            return _ZERO
 
-        # Calculate average cost per share
         # Fraction: (quantity_sold / total_pool_quantity) * total_pool_cost
-        # Doing it this way avoids rounding issues with "per share" price on small lots
+        # Multiplying before the (half-even) division rounds once, at the last cost
+        # unit, and avoids rounding issues with "per share" price on small lots.
+        qty_u = _to_units(quantity, QTY_PLACES)
 
-        # Determine the cost proportion
-        cost_for_qty = (quantity / self.total_quantity) * self.total_cost
+        # Closing out the whole holding: the answer is simply the pooled cost
+        if qty_u == self._quantity_u:
+            cost_u = self._cost_u
+            self._quantity_u = 0
+            self._cost_u = 0
+            return _from_units(cost_u, COST_PLACES)
 
-        # Rounding is tricky in tax.
-        # Standard practice: Round to 2DP? Or keep precision?
-        # We'll keep full precision for internal calc, round at reporting if needed.
-        # But `cost_for_qty` effectively becomes a realised cost.
+        cost_u = _div_half_even(qty_u * self._cost_u, self._quantity_u)
 
         # Update pool state
-        self.total_quantity -= quantity
-        self.total_cost -= cost_for_qty
+        self._quantity_u -= qty_u
+        self._cost_u -= cost_u
 
-        # Handle floating point leftovers near zero
-        if self.total_quantity <= Decimal("0.000001"): # Epsilon check
-            self.total_quantity = Decimal("0.00")
-            self.total_cost = Decimal("0.00")
+        # Integer state: an emptied pool is exactly zero. Overselling also clears it.
+        if self._quantity_u <= 0:
+            self._quantity_u = 0
+            self._cost_u = 0
 
-        return cost_for_qty
+        return _from_units(cost_u, COST_PLACES)
 
     @property
     def average_cost_per_share(self) -> Decimal:
-        if self.total_quantity == 0:
-            return Decimal("0.00")
-        return self.total_cost / self.total_quantity
+        if self._quantity_u == 0:
+            return _ZERO
+        return _CTX.divide(self.total_cost, self.total_quantity)
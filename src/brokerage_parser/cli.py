@@ -1,28 +1,27 @@
 import argparse
+import atexit
+import os
 import sys
 import time
 import json
 import random
-import logging
+from collections import Counter, deque
+from collections.abc import Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
 
 # --- RICH IMPORTS ---
 from rich.console import Console, Group
-from rich.progress import (
-    Progress, SpinnerColumn, BarColumn, TextColumn,
-    TimeElapsedColumn, TaskID
-)
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
-from rich.live import Live
 from rich.theme import Theme
-from rich.layout import Layout
-from rich.tree import Tree
-from rich.syntax import Syntax
 from rich.align import Align
+# rich.layout / rich.live / rich.progress are imported where the dashboard is
+# built, so machine-readable runs never load them
 from rich import box
 
 # --- MOCK / REAL IMPORT TOGGLE ---
@@ -30,6 +29,18 @@ from brokerage_parser import orchestrator
 from brokerage_parser import export
 from brokerage_parser import storage
 
+# Optional fast JSON encoder for --json / --ndjson output
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps_compact(obj) -> str:
+    """One-line JSON plus newline, for NDJSON records."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode() + "\n"
+    return json.dumps(obj, separators=(",", ":")) + "\n"
+
 # --- THEME CONFIGURATION ---
 # Professional enterprise color scheme - muted, sophisticated
 custom_theme = Theme({
@@ -65,6 +76,40 @@ console = Console(
 class MockAccount:
     def __init__(self): self.account_number = f"****{random.randint(1000,9999)}"
 
+def _mock_transactions(count: int) -> List[Dict]:
+    """Draw every column in one vectorized call each; only the dict assembly is per-row."""
+    import numpy as np  # Lazy: only demo/mock runs need it
+    rng = np.random.default_rng()
+    months = rng.integers(1, 13, count).tolist()
+    days = rng.integers(1, 29, count).tolist()
+    amounts = np.round(rng.uniform(10.0, 5000.0, count), 2).tolist()
+    types = rng.choice(["BUY", "SELL", "DIVIDEND"], count).tolist()
+    symbols = rng.choice(["AAPL", "GOOGL", "MSFT", "TSLA", "VTI", "VOO"], count).tolist()
+
+    return [
+        {
+            "date": f"2023-{month:02d}-{day:02d}",
+            "amount": amount,
+            "type": txn_type,
+            "symbol": symbol
+        }
+        for month, day, amount, txn_type, symbol in zip(months, days, amounts, types, symbols)
+    ]
+
+class _LazyMockTransactions(Sequence):
+    """Sized like the transaction list; the rows are built on first index/iteration."""
+    def __init__(self, count: int):
+        self._count = count
+        self._rows = None
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index):
+        if self._rows is None:
+            self._rows = _mock_transactions(self._count)
+        return self._rows[index]
+
 class MockStatement:
     def __init__(self, filename, txn_count=None):
         self.broker = random.choice(["Fidelity", "Vanguard", "Schwab", "E*TRADE", "Morgan Stanley"])
@@ -74,15 +119,8 @@ class MockStatement:
         # Determine transaction count: explicit, or random based on demo variance
         count = txn_count if txn_count is not None else random.randint(5, 50)
 
-        self.transactions = [
-            {
-                "date": f"2023-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-                "amount": round(random.uniform(10.0, 5000.0), 2),
-                "type": random.choice(["BUY", "SELL", "DIVIDEND"]),
-                "symbol": random.choice(["AAPL", "GOOGL", "MSFT", "TSLA", "VTI", "VOO"])
-            }
-            for _ in range(count)
-        ]
+        # Rows are only generated if something reads them (exports); the batch summary needs len()
+        self.transactions = _LazyMockTransactions(count)
         self.positions = [1] * random.randint(1, 15)
         self.parse_errors = []
 
@@ -96,32 +134,67 @@ class MockStatement:
         return {
             "broker": self.broker,
             "account": self.account.account_number,
-            "txns": self.transactions,
+            "txns": list(self.transactions),
             "positions": len(self.positions),
             "errors": self.parse_errors
         }
 
+# Toggled by --mock and demo mode
+USE_MOCK = False
+
 # Global Settings
 GLOBAL_SETTINGS = {
     "include_sources": False,
     "output_format": "json"  # json, csv, markdown
 }
 
-def process_wrapper(path, include_sources=False, mock_txn_count=None):
-    """Wrapper to switch between Mock and Real logic dynamically."""
-    if USE_MOCK:
-        # Simulate varying processing times for realism
-        time.sleep(random.uniform(0.3, 0.8))
+def process_wrapper(path, include_sources=False, mock_txn_count=None, use_mock=None):
+    """
+    Wrapper to switch between Mock and Real logic dynamically.
+    use_mock=None follows the module-level USE_MOCK (worker processes pass it explicitly).
+    """
+    if USE_MOCK if use_mock is None else use_mock:
+        # Simulate varying processing times for realism (skipped for benchmarks / CI)
+        if not os.environ.get("PARSEFIN_FAST_MOCK"):
+            time.sleep(random.uniform(0.3, 0.8))
         return MockStatement(path, txn_count=mock_txn_count)
     # REAL LOGIC
     return orchestrator.process_statement(str(path), include_sources=include_sources)
 
 # --- UI COMPONENT MANAGER ---
 
+# Dashboard status -> (status cell, file cell style) for the results table. The cells
+# are shared Text objects: rendering never mutates them, and no markup is re-parsed
+_STATUS_STYLE = {
+    "Success": (Text("OK", style="green"), "white"),
+    "Partial": (Text("WARN", style="yellow"), "yellow"),
+    "Failed": (Text("FAIL", style="red"), "dim red"),
+}
+
+# Notes cell for rows without an error
+_NO_NOTES = Text("-", style="dim")
+
+# Dashboard status -> status cell markup in the final report's issues table
+_ISSUE_STATUS_MARKUP = {
+    "Partial": "[yellow]Partial[/]",
+    "Failed": "[red]Failed[/]",
+}
+
+# Result rows kept on screen in the dashboard table
+_VISIBLE_ROWS = 30
+
+# Dashboard.log level -> Rich color; unknown levels render white
+_LEVEL_COLORS = {"info": "white", "error": "red", "success": "green", "warn": "yellow"}
+
 class Dashboard:
     """Manages the layout and components of the TUI."""
 
     def __init__(self):
+        from rich.layout import Layout
+        from rich.progress import (
+            Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+        )
+
         self.layout = Layout()
         self.layout.split(
             Layout(name="header", size=3),
@@ -133,7 +206,12 @@ class Dashboard:
             Layout(name="log", ratio=1)
         )
 
-        self.log_messages = []
+        self.log_messages = deque(maxlen=15) # Keep only last 15 messages
+        # (epoch minute, header Panel) and (epoch second, "HH:MM:SS")
+        self._header_cache = (None, None)
+        self._ts_cache = (None, "")
+        # Only the newest rows are rendered; full results live in results_data
+        self._visible_rows = deque(maxlen=_VISIBLE_ROWS)
         self.table = self._create_table()
         self.progress = Progress(
             SpinnerColumn(style="brand"),
@@ -144,6 +222,30 @@ class Dashboard:
             expand=True
         )
 
+        # Table and progress are mutated in place, so their Panel wrappers are built once
+        self._set_table_panel()
+        self.layout["footer"].update(Panel(self.progress, title="Progress", border_style="dim", box=box.SIMPLE))
+        self._log_panel = None
+        self._log_dirty = True
+
+    def _set_table_panel(self):
+        self.layout["table"].update(Panel(self.table, title="Processing Results", border_style="dim", box=box.SIMPLE))
+
+    def add_row(self, *cells):
+        """
+        Append a result row. Once the table holds _VISIBLE_ROWS rows it is rebuilt
+        from the newest ones, so render cost stays flat however large the batch.
+        """
+        self._visible_rows.append(cells)
+        if len(self.table.rows) < _VISIBLE_ROWS:
+            self.table.add_row(*cells)
+            return
+
+        self.table = self._create_table()
+        for row in self._visible_rows:
+            self.table.add_row(*row)
+        self._set_table_panel()
+
     def _create_table(self) -> Table:
         table = Table(
             expand=True,
@@ -161,47 +263,57 @@ class Dashboard:
         return table
 
     def get_header(self) -> Panel:
+        # The header only shows the minute, so rebuild it at most once a minute
+        minute = int(time.time()) // 60
+        if minute == self._header_cache[0]:
+            return self._header_cache[1]
+
         grid = Table.grid(expand=True)
         grid.add_column(justify="left", ratio=1)
         grid.add_column(justify="right", ratio=1)
         grid.add_row(
             "[bold]ParseFin[/] [dim]Statement Parser[/]",
-            f"[dim]{datetime.now().strftime('%Y-%m-%d %H:%M')}[/]"
+            f"[dim]{time.strftime('%Y-%m-%d %H:%M', time.localtime(minute * 60))}[/]"
         )
-        return Panel(grid, style="on #1a1a2e", box=box.SIMPLE)
+        panel = Panel(grid, style="on #1a1a2e", box=box.SIMPLE)
+        self._header_cache = (minute, panel)
+        return panel
+
+    def _timestamp(self) -> str:
+        """HH:MM:SS for log lines; formatted once per second however many lines share it."""
+        second = int(time.time())
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+        return self._ts_cache[1]
 
     def log(self, message: str, level="info"):
         """Adds a message to the side log."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        color = "white"
-        if level == "error": color = "red"
-        if level == "success": color = "green"
-        if level == "warn": color = "yellow"
-
-        self.log_messages.append(f"[dim]{timestamp}[/] [{color}]{message}[/]")
-        if len(self.log_messages) > 15: # Keep only last 15 messages
-            self.log_messages.pop(0)
+        color = _LEVEL_COLORS.get(level, "white")
+        self.log_messages.append(f"[dim]{self._timestamp()}[/] [{color}]{message}[/]")
+        self._log_dirty = True
 
     def get_log_panel(self) -> Panel:
-        return Panel(
-            "\n".join(self.log_messages),
-            title="[bold]System Log",
-            border_style="dim white",
-            box=box.ROUNDED,
-            padding=(0, 1)
-        )
+        # Rebuilt only after log() has added a line
+        if self._log_dirty:
+            self._log_panel = Panel(
+                "\n".join(self.log_messages),
+                title="[bold]System Log",
+                border_style="dim white",
+                box=box.ROUNDED,
+                padding=(0, 1)
+            )
+            self._log_dirty = False
+        return self._log_panel
 
     def update_layout(self):
-        """Updates the renderables in the layout."""
+        """Updates the renderables in the layout; unchanged panels are reused."""
         self.layout["header"].update(self.get_header())
-        self.layout["table"].update(Panel(self.table, title="Processing Results", border_style="dim", box=box.SIMPLE))
         self.layout["log"].update(self.get_log_panel())
-        self.layout["footer"].update(Panel(self.progress, title="Progress", border_style="dim", box=box.SIMPLE))
         return self.layout
 
 # --- MAIN LOGIC ---
 
-def process_batch(pdf_files: List[Path], args, mock_txn_count=None):
+def process_batch(pdf_files: List[Union[str, Path]], args, mock_txn_count=None):
     """
     Process a batch of PDFs with TTY-aware output.
 
@@ -230,7 +342,155 @@ def process_batch(pdf_files: List[Path], args, mock_txn_count=None):
         return process_batch_gui(pdf_files, args, include_sources, output_format, output_dir, mock_txn_count)
 
 
-def process_batch_plain(pdf_files: List[Path], args, include_sources, output_format, output_dir, mock_txn_count=None):
+# Output format -> (export module function, file extension)
+_EXPORT_FORMATS = {
+    "json": ("to_json", "json"),
+    "csv": ("to_csv", "csv"),
+    "markdown": ("to_markdown", "md"),
+}
+
+def prepare_export(output_format, output_dir):
+    """
+    Resolve the export target once per batch: creates output_dir and returns
+    (export_fn, extension, out_path), or None when nothing should be written.
+    """
+    if not output_dir or output_format not in _EXPORT_FORMATS:
+        return None
+    fn_name, ext = _EXPORT_FORMATS[output_format]
+    export_fn = getattr(export, fn_name, None)
+    if export_fn is None:
+        return None
+
+    out_path = Path(output_dir)
+    out_path.mkdir(parents=True, exist_ok=True)
+    return export_fn, ext, out_path
+
+
+def export_statement(statement, pdf: Union[str, Path], export_target):
+    """Write one parsed statement to the target from prepare_export()."""
+    export_fn, ext, out_path = export_target
+    stem = os.path.splitext(os.path.basename(pdf))[0]
+    export_fn(statement, str(out_path / f"{stem}.{ext}"))
+
+
+# Shared across batches in one CLI session; workers are started on first use
+_POOL: Optional[ProcessPoolExecutor] = None
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the session-wide worker pool, creating it on first use."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        atexit.register(_POOL.shutdown)
+    return _POOL
+
+
+def _completed_bounded(executor, fn, items, limit: int):
+    """
+    Like as_completed over {executor.submit(fn, item): item}, but with at most
+    `limit` futures in flight, so a large batch never queues every file's
+    arguments and results at once. Yields (item, future) in completion order.
+    """
+    items = iter(items)
+    pending = {}
+    for item in items:
+        pending[executor.submit(fn, item)] = item
+        if len(pending) >= limit:
+            break
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+            for item in items:
+                pending[executor.submit(fn, item)] = item
+                break
+
+
+def _parse_one(pdf: Union[str, Path], include_sources, mock_txn_count=None, use_mock=None):
+    """Parse a single PDF; returns (result dict, statement or None on failure)."""
+    pdf_str = os.fspath(pdf)
+    result = {
+        "file": os.path.basename(pdf_str),
+        "path": pdf_str,
+        "status": "pending",
+        "broker": None,
+        "account": None,
+        "transactions": 0,
+        "error": None
+    }
+
+    statement = None
+    try:
+        statement = process_wrapper(pdf_str, include_sources=include_sources, mock_txn_count=mock_txn_count, use_mock=use_mock)
+
+        result["broker"] = statement.broker
+        # getattr's default would be built (str(account)) even when the attribute exists
+        try:
+            acc = statement.account.account_number
+        except AttributeError:
+            acc = str(statement.account)
+        result["account"] = acc[-4:] if acc else None
+        result["transactions"] = len(statement.transactions)
+
+        if statement.parse_errors:
+            result["status"] = "warning"
+            result["error"] = statement.parse_errors[0] if statement.parse_errors else None
+        else:
+            result["status"] = "success"
+
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+
+    return result, statement
+
+
+def _process_one(pdf: Union[str, Path], include_sources, export_target, mock_txn_count=None, use_mock=None) -> Dict:
+    """
+    Parse (and optionally export) a single PDF.
+
+    Module-level and returns a plain dict so it can run in a worker process.
+    """
+    result, statement = _parse_one(pdf, include_sources, mock_txn_count, use_mock)
+
+    # Export Logic: a failed export fails this file only, not the whole pool.map batch
+    if export_target and statement is not None:
+        try:
+            export_statement(statement, pdf, export_target)
+        except Exception as e:
+            result["status"] = "error"
+            result["error"] = str(e)
+
+    return result
+
+
+# _parse_one status -> dashboard status
+_GUI_STATUS = {"success": "Success", "warning": "Partial", "error": "Failed"}
+
+def _to_gui_result(result: Dict) -> Dict:
+    """Reshape a _parse_one / _process_one result for the dashboard table and final report."""
+    status = _GUI_STATUS[result["status"]]
+    if status == "Failed":
+        broker, account = "-", "-"
+    else:
+        broker, account = result["broker"], result["account"] or "????"
+    return {
+        "file": result["file"],
+        "status": status,
+        "broker": broker,
+        "account": account,
+        "txns": result["transactions"],
+        "error": str(result["error"]) if result["error"] is not None else None,
+    }
+
+
+# Plain-mode progress lines, formatted straight from the result dict
+_PROGRESS_FAIL = "[{i}/{n}] FAIL: {file} - {error}\n".format
+_PROGRESS_DONE = "[{i}/{n}] {mark}: {file} ({broker}, {transactions} txns)\n".format
+_PROGRESS_MARK = {"success": "OK", "warning": "WARN"}
+
+
+def process_batch_plain(pdf_files: List[Union[str, Path]], args, include_sources, output_format, output_dir, mock_txn_count=None):
     """
     Process PDFs with machine-readable or plain text output.
 
@@ -250,183 +510,189 @@ def process_batch_plain(pdf_files: List[Path], args, include_sources, output_for
     if show_progress:
         print(f"ParseFin: Processing {len(pdf_files)} file(s)...", file=sys.stderr)
 
-    for i, pdf in enumerate(pdf_files, 1):
-        result = {
-            "file": str(pdf.name),
-            "path": str(pdf),
-            "status": "pending",
-            "broker": None,
-            "account": None,
-            "transactions": 0,
-            "error": None
-        }
+    total = len(pdf_files)
+    job = partial(
+        _process_one,
+        include_sources=include_sources,
+        export_target=prepare_export(output_format, output_dir),
+        mock_txn_count=mock_txn_count,
+        use_mock=USE_MOCK,
+    )
 
-        try:
-            statement = process_wrapper(str(pdf), include_sources=include_sources, mock_txn_count=mock_txn_count)
+    # Files are independent, so parse them on all cores; a single file stays in-process
+    workers = min(os.cpu_count() or 1, total)
+    if workers > 1:
+        results_iter = get_pool().map(job, pdf_files, chunksize=max(1, total // (workers * 4)))
+    else:
+        results_iter = map(job, pdf_files)
 
-            result["broker"] = statement.broker
-            acc = getattr(statement.account, 'account_number', str(statement.account))
-            result["account"] = acc[-4:] if acc else None
-            result["transactions"] = len(statement.transactions)
+    # Bound once: a plain write per line, no print() formatting
+    write_line = sys.stdout.write
+    write_progress = sys.stderr.write
 
-            if statement.parse_errors:
-                result["status"] = "warning"
-                result["error"] = statement.parse_errors[0] if statement.parse_errors else None
+    # map() yields in input order, so progress and NDJSON keep the file order
+    for i, result in enumerate(results_iter, 1):
+        if show_progress:
+            if result["status"] == "error":
+                write_progress(_PROGRESS_FAIL(i=i, n=total, **result))
             else:
-                result["status"] = "success"
-
-            if show_progress:
-                status_mark = "OK" if result["status"] == "success" else "WARN"
-                print(f"[{i}/{len(pdf_files)}] {status_mark}: {pdf.name} ({result['broker']}, {result['transactions']} txns)", file=sys.stderr)
-
-        except Exception as e:
-            result["status"] = "error"
-            result["error"] = str(e)
-            if show_progress:
-                print(f"[{i}/{len(pdf_files)}] FAIL: {pdf.name} - {e}", file=sys.stderr)
+                write_progress(_PROGRESS_DONE(i=i, n=total, mark=_PROGRESS_MARK[result["status"]], **result))
 
         results_data.append(result)
 
-        # Export Logic
-        if output_dir:
-            out_path = Path(output_dir)
-            out_path.mkdir(parents=True, exist_ok=True)
-
-            base_name = pdf.stem
-            if output_format == "json":
-                export.to_json(statement, str(out_path / f"{base_name}.json"))
-            elif output_format == "csv":
-                export.to_csv(statement, str(out_path / f"{base_name}.csv"))
-            elif output_format == "markdown":
-                if hasattr(export, 'to_markdown'):
-                        export.to_markdown(statement, str(out_path / f"{base_name}.md"))
-
-
         # NDJSON: Stream each result immediately
         if use_ndjson:
-            print(json.dumps(result))
+            write_line(_dumps_compact(result))
+
+    if use_ndjson:
+        sys.stdout.flush()
+
+    # Final output: one pass over the results for all three tallies
+    counts = Counter(r["status"] for r in results_data)
+    success, warnings, errors = counts["success"], counts["warning"], counts["error"]
 
-    # Final output
     if use_json:
         # Complete JSON object
         output = {
             "success": True,
             "processed": len(pdf_files),
             "summary": {
-                "success": sum(1 for r in results_data if r["status"] == "success"),
-                "warnings": sum(1 for r in results_data if r["status"] == "warning"),
-                "errors": sum(1 for r in results_data if r["status"] == "error"),
+                "success": success,
+                "warnings": warnings,
+                "errors": errors,
             },
             "results": results_data
         }
-        print(json.dumps(output, indent=2))
+        # Indented for people (terminal or --pretty); compact when piped to another program
+        if IS_TTY or getattr(args, 'pretty', False):
+            if orjson is not None:
+                sys.stdout.write(orjson.dumps(output, option=orjson.OPT_INDENT_2).decode())
+            else:
+                json.dump(output, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+        else:
+            sys.stdout.write(_dumps_compact(output))
     elif not use_ndjson:
         # Plain text summary
-        success = sum(1 for r in results_data if r["status"] == "success")
-        warnings = sum(1 for r in results_data if r["status"] == "warning")
-        errors = sum(1 for r in results_data if r["status"] == "error")
         if show_progress:
             print(f"\nComplete: {success} success, {warnings} warnings, {errors} errors", file=sys.stderr)
 
     return results_data
 
 
-def process_batch_gui(pdf_files: List[Path], args, include_sources, output_format, output_dir, mock_txn_count=None):
+def process_batch_gui(pdf_files: List[Union[str, Path]], args, include_sources, output_format, output_dir, mock_txn_count=None):
     """Interactive Rich dashboard for TTY environments."""
+    from rich.live import Live
+
     dashboard = Dashboard()
     results_data = []
 
-    task_id = dashboard.progress.add_task("Initializing...", total=len(pdf_files))
-
-    with Live(dashboard.update_layout(), refresh_per_second=12, console=console, screen=True) as live:
-
-        dashboard.log(f"Found {len(pdf_files)} files to process.")
+    total = len(pdf_files)
+    task_id = dashboard.progress.add_task("Initializing...", total=total)
+    export_target = prepare_export(output_format, output_dir)
+
+    # Files are independent, so parse them on all cores; a single file/core stays in-process
+    workers = min(os.cpu_count() or 1, total)
+
+    # Forced redraws are capped at ~12/s, so a burst of fast files costs a few frames
+    # rather than one per file; a skipped frame is drawn by Live's own 4 Hz refresh
+    last_redraw = 0.0
+
+    def push(force=False):
+        nonlocal last_redraw
+        now = time.monotonic()
+        redraw = force or now - last_redraw >= 0.08
+        if redraw:
+            last_redraw = now
+        live.update(dashboard.update_layout(), refresh=redraw)
+
+    def record(result):
+        """Log, tabulate and count one finished file."""
+        name = result["file"]
+        if result["status"] == "Success":
+            dashboard.log(f"Parsed {name}: {result['txns']} txns", level="success")
+        elif result["status"] == "Partial":
+            dashboard.log(f"Warning in {name}", level="warn")
+        else:  # Failed
+            dashboard.log(f"Failed {name}: {result['error']}", level="error")
+
+        # Update Table - Professional status indicators
+        status_cell, style = _STATUS_STYLE[result["status"]]
+        dashboard.add_row(
+            status_cell,
+            Text(name, style=style),
+            result["broker"],
+            result["account"],
+            str(result["txns"]),
+            Text(result["error"], style="red") if result["error"] else _NO_NOTES
+        )
 
-        for pdf in pdf_files:
-            # 1. Update Status: Running
-            dashboard.progress.update(task_id, description=f"Processing [bold cyan]{pdf.name}[/]")
-            dashboard.log(f"Starting {pdf.name}...", level="info")
+        results_data.append(result)
+        dashboard.progress.advance(task_id)
+        push()
+
+    # Redraws are pushed at file events (throttled by push); the slow auto refresh
+    # animates the spinner and elapsed time while a parse is running
+    with Live(dashboard.update_layout(), refresh_per_second=4, console=console, screen=True) as live:
+
+        dashboard.log(f"Found {total} files to process.")
+
+        if workers > 1:
+            # Workers parse and export; rows appear in completion order
+            dashboard.progress.update(task_id, description=f"Processing on [bold cyan]{workers}[/] workers")
+            push(force=True)
+
+            job = partial(
+                _process_one,
+                include_sources=include_sources,
+                export_target=export_target,
+                mock_txn_count=mock_txn_count,
+                use_mock=USE_MOCK,
+            )
+            # A few files queued per worker keeps every core busy without holding the whole batch
+            for pdf, future in _completed_bounded(get_pool(), job, pdf_files, workers * 4):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Export failures (or a dead worker) surface here
+                    result = {"file": os.path.basename(pdf), "status": "error", "broker": None,
+                              "account": None, "transactions": 0, "error": str(e)}
+                record(_to_gui_result(result))
+        else:
+            # Exports are pure IO (GIL released on write), so overlap them with parsing
+            io_pool = ThreadPoolExecutor(max_workers=4)
+            pending_exports = {}
 
-            # Temporary row for current item (optional, or just add row at end)
-            result = {
-                "file": pdf.name,
-                "status": "Running",
-                "broker": "-",
-                "account": "-",
-                "txns": 0,
-                "error": None
-            }
+            for pdf in pdf_files:
+                pdf_name = os.path.basename(pdf)
+                # 1. Update Status: Running
+                dashboard.progress.update(task_id, description=f"Processing [bold cyan]{pdf_name}[/]")
+                dashboard.log(f"Starting {pdf_name}...", level="info")
+                push()
 
-            try:
                 # --- PARSE ---
-                statement = process_wrapper(str(pdf), include_sources=include_sources, mock_txn_count=mock_txn_count)
+                result, statement = _parse_one(pdf, include_sources, mock_txn_count)
                 # -------------
 
-                result["broker"] = statement.broker
-                acc = getattr(statement.account, 'account_number', str(statement.account))
-                result["account"] = acc[-4:] if acc else "????"
-                result["txns"] = len(statement.transactions)
-                result["data"] = statement
-
-                if statement.parse_errors:
-                    result["status"] = "Partial"
-                    result["error"] = str(statement.parse_errors[0])
-                    dashboard.log(f"Warning in {pdf.name}", level="warn")
-                else:
-                    result["status"] = "Success"
-                    dashboard.log(f"Parsed {pdf.name}: {result['txns']} txns", level="success")
-
-                # Export Logic
-                if output_dir:
-                    out_path = Path(output_dir)
-                    out_path.mkdir(parents=True, exist_ok=True)
-
-                    base_name = pdf.stem
-                    if output_format == "json":
-                        export.to_json(statement, str(out_path / f"{base_name}.json"))
-                    elif output_format == "csv":
-                        export.to_csv(statement, str(out_path / f"{base_name}.csv"))
-                    elif output_format == "markdown":
-                        # We just added this to export.py
-                        if hasattr(export, 'to_markdown'):
-                             export.to_markdown(statement, str(out_path / f"{base_name}.md"))
-                        else:
-                            dashboard.log(f"Markdown export not implemented", level="warn")
-
-                    dashboard.log(f"Saved {output_format.upper()} to {out_path.name}", level="info")
-
-            except Exception as e:
-                result["status"] = "Failed"
-                result["error"] = str(e)
-                dashboard.log(f"Failed {pdf.name}: {str(e)}", level="error")
-
-            # Update Table - Professional status indicators
-            if result["status"] == "Success":
-                status_text = "[green]OK[/]"
-                style = "white"
-            elif result["status"] == "Partial":
-                status_text = "[yellow]WARN[/]"
-                style = "yellow"
-            else:  # Failed
-                status_text = "[red]FAIL[/]"
-                style = "dim red"
-
-            dashboard.table.add_row(
-                status_text,
-                Text(result["file"], style=style),
-                result["broker"],
-                result["account"],
-                str(result["txns"]),
-                Text(result["error"] if result["error"] else "-", style="dim" if not result["error"] else "red")
-            )
+                # Export Logic: disk writes run on the IO pool while the next file parses
+                if export_target and statement is not None:
+                    pending_exports[io_pool.submit(export_statement, statement, pdf, export_target)] = pdf_name
 
-            results_data.append(result)
-            dashboard.progress.advance(task_id)
-            live.update(dashboard.update_layout())
+                record(_to_gui_result(result))
+
+            # Every export must be on disk before the batch returns
+            for future in as_completed(pending_exports):
+                name = pending_exports[future]
+                try:
+                    future.result()
+                    dashboard.log(f"Saved {output_format.upper()} for {name}", level="info")
+                except Exception as e:
+                    dashboard.log(f"Export failed for {name}: {e}", level="error")
+            io_pool.shutdown()
+
+        # Last frame always shows the finished batch
+        push(force=True)
 
-    # End of Live Context
-    # End of Live Context
-    # End of Live Context
     show_final_report(results_data)
 
     # Prompt to launch frontend if we have results
@@ -450,26 +716,26 @@ def prepare_and_store_report(statement, pdf_path):
     """Store PDF and Report to persistent storage context."""
     from dataclasses import asdict, is_dataclass
 
-    # 1. Store PDF
-    doc_id = storage.store_document(Path(pdf_path))
+    # 1. Store PDF: a file copy, so it runs on a thread while the report is serialized
+    with ThreadPoolExecutor(max_workers=1) as io:
+        doc_future = io.submit(storage.store_document, Path(pdf_path))
 
-    # 2. Serialize Report
-    if is_dataclass(statement):
-        report_dict = asdict(statement)
-    elif hasattr(statement, "to_dict"):
-        report_dict = statement.to_dict()
-    else:
-        report_dict = statement # Assume dict
+        # 2. Serialize Report
+        if is_dataclass(statement):
+            report_dict = asdict(statement)
+        elif hasattr(statement, "to_dict"):
+            report_dict = statement.to_dict()
+        else:
+            report_dict = statement # Assume dict
+
+        doc_id = doc_future.result()
 
     # Inject doc_id into metadata
     if "metadata" in report_dict:
         report_dict["metadata"]["document_id"] = doc_id
 
-    # 3. Store Report using custom logic to handle Decimals/Dates
-    # We use json.loads(json.dumps(...)) to ensure it's pure JSON standard types for storage
-    # or just pass rely on storage.store_report to handle it?
-    # storage.store_report uses json.dump w/ default=str.
-    # But it's safer to ensure we match API structure.
+    # 3. Store Report: storage.store_report serializes with default=str, so
+    # Decimals/dates need no json.loads(json.dumps(...)) normalisation pass here
     storage.store_report(doc_id, report_dict)
 
     return doc_id
@@ -501,11 +767,11 @@ def run_demo_mode():
     filenames = []
     for i in range(1, file_count + 1):
         if i == file_count: # Last one might be broken for demo effect
-            filenames.append(Path("corrupted_scan_2023.pdf"))
+            filenames.append("corrupted_scan_2023.pdf")
         elif i == 2:
-            filenames.append(Path("partial_read_warning.pdf"))
+            filenames.append("partial_read_warning.pdf")
         else:
-            filenames.append(Path(f"statement_2023_{i:02d}.pdf"))
+            filenames.append(f"statement_2023_{i:02d}.pdf")
 
     # Prepare Demo Arguments
     demo_args = argparse.Namespace(
@@ -559,14 +825,19 @@ def show_final_report(results):
     """Generates a static report after the live mode exits."""
     console.clear()
 
-    success = sum(1 for r in results if r['status'] == 'Success')
-    partial = sum(1 for r in results if r['status'] == 'Partial')
-    failed = sum(1 for r in results if r['status'] == 'Failed')
-    total_txns = sum(r.get('txns', 0) for r in results)
+    # One pass for the status tallies and the transaction total
+    counts = Counter()
+    total_txns = 0
+    for r in results:
+        counts[r['status']] += 1
+        total_txns += r.get('txns', 0)
+    success, partial, failed = counts['Success'], counts['Partial'], counts['Failed']
+
+    # Assembled into one Group so the whole report is laid out and written in a single print
+    parts = [Text("")]
 
     # Header
-    console.print()
-    console.print(Panel(
+    parts.append(Panel(
         Align.center(f"[bold]Processing Complete[/]\n[dim]{len(results)} statements processed[/]"),
         box=box.SIMPLE,
         style=""
@@ -585,12 +856,12 @@ def show_final_report(results):
         f"[bold red]{failed}[/]\n[dim]Failed[/]" if failed else f"[dim]{failed}[/]\n[dim]Failed[/]",
         f"[bold]{total_txns}[/]\n[dim]Transactions[/]",
     )
-    console.print(Align.center(stats_table))
-    console.print()
+    parts.append(Align.center(stats_table))
+    parts.append(Text(""))
 
     # Issues section - if any
     if failed > 0 or partial > 0:
-        console.print(Panel(
+        parts.append(Panel(
             "[bold]Issues Detected[/]",
             box=box.SIMPLE,
             style="yellow" if partial and not failed else "red"
@@ -606,17 +877,17 @@ def show_final_report(results):
                 err_msg = r.get('error', 'Unknown error')
                 if isinstance(err_msg, list):
                     err_msg = "; ".join(err_msg)
-                status_style = "yellow" if r['status'] == "Partial" else "red"
                 issues_table.add_row(
                     r['file'],
-                    f"[{status_style}]{r['status']}[/]",
+                    _ISSUE_STATUS_MARKUP[r['status']],
                     Text(str(err_msg), style="dim")
                 )
 
-        console.print(issues_table)
-        console.print()
+        parts.append(issues_table)
+        parts.append(Text(""))
 
-    console.print("[dim]Press Enter to continue...[/]")
+    parts.append("[dim]Press Enter to continue...[/]")
+    console.print(Group(*parts))
     input()
 
 # --- UTILS & MENU ---
@@ -625,55 +896,67 @@ def find_pdf_files(input_path: Path) -> List[Path]:
     if input_path.is_file() and input_path.suffix.lower() == '.pdf':
         return [input_path]
     elif input_path.is_dir():
-        return sorted(list(input_path.glob('*.pdf')))
+        # scandir's DirEntry carries the file type, so filtering needs no per-entry stat
+        with os.scandir(input_path) as entries:
+            files = [Path(e.path) for e in entries if e.name.lower().endswith('.pdf') and e.is_file()]
+        return sorted(files)
     return []
 
+@lru_cache(maxsize=8)
+def _menu_screen(include_sources, output_format) -> Group:
+    """
+    The menu's header, option table and footer. Rich renderables are read-only
+    at render time, so each settings combination is built once and redrawn as-is.
+    """
+    # Professional header
+    header = Table.grid(expand=True)
+    header.add_column(justify="center")
+    header.add_row("[bold]ParseFin[/]")
+    header.add_row("[dim]Brokerage Statement Parser[/]")
+
+    # Menu Options - Clean table format
+    menu = Table(
+        box=box.SIMPLE,
+        show_header=False,
+        padding=(0, 2),
+        expand=False
+    )
+    menu.add_column("Option", style="bold", width=8)
+    menu.add_column("Action", width=28)
+    menu.add_column("Description", style="dim")
+
+    menu.add_row("[1]", "Process Single PDF", "Parse one statement")
+    menu.add_row("[2]", "Batch Process", "Process all PDFs in a directory")
+    menu.add_row("[4]", "Run Comprehensive Demo", "Simulated batch with customization")
+    menu.add_row("[5]", "Start Frontend UI", "Launch React Workbench")
+    menu.add_row("[6]", "Settings", f"Src: {include_sources} | Fmt: {output_format}")
+    menu.add_row("[0]", "Exit", "")
+
+    # Header, menu and capabilities footer in a single print
+    return Group(
+        Text(""),
+        Panel(header, box=box.SIMPLE, style=""),
+        Text(""),
+        Align.center(menu),
+        Text(""),
+        Align.center(Text(
+            "Schwab | Fidelity | Vanguard | Interactive Brokers",
+            style="dim"
+        )),
+        Align.center(Text(
+            "Transaction extraction | Holdings | UK CGT | Tax wrapper detection",
+            style="dim"
+        )),
+        Text(""),
+    )
+
 def interactive_menu():
     from rich.prompt import Prompt
 
     while True:
         console.clear()
 
-        # Professional header
-        console.print()
-        header = Table.grid(expand=True)
-        header.add_column(justify="center")
-        header.add_row("[bold]ParseFin[/]")
-        header.add_row("[dim]Brokerage Statement Parser[/]")
-        console.print(Panel(header, box=box.SIMPLE, style=""))
-        console.print()
-
-        # Menu Options - Clean table format
-        menu = Table(
-            box=box.SIMPLE,
-            show_header=False,
-            padding=(0, 2),
-            expand=False
-        )
-        menu.add_column("Option", style="bold", width=8)
-        menu.add_column("Action", width=28)
-        menu.add_column("Description", style="dim")
-
-        menu.add_row("[1]", "Process Single PDF", "Parse one statement")
-        menu.add_row("[2]", "Batch Process", "Process all PDFs in a directory")
-        menu.add_row("[4]", "Run Comprehensive Demo", "Simulated batch with customization")
-        menu.add_row("[5]", "Start Frontend UI", "Launch React Workbench")
-        menu.add_row("[6]", "Settings", f"Src: {GLOBAL_SETTINGS['include_sources']} | Fmt: {GLOBAL_SETTINGS['output_format']}")
-        menu.add_row("[0]", "Exit", "")
-
-        console.print(Align.center(menu))
-        console.print()
-
-        # Capabilities footer
-        console.print(Align.center(Text(
-            "Schwab | Fidelity | Vanguard | Interactive Brokers",
-            style="dim"
-        )))
-        console.print(Align.center(Text(
-            "Transaction extraction | Holdings | UK CGT | Tax wrapper detection",
-            style="dim"
-        )))
-        console.print()
+        console.print(_menu_screen(GLOBAL_SETTINGS['include_sources'], GLOBAL_SETTINGS['output_format']))
 
         choice = Prompt.ask(" Select Option", choices=["1", "2", "3", "4", "5", "6", "0"], default="1")
 
@@ -749,24 +1032,24 @@ def start_frontend(url=None):
         console.print(f"\n[red]Failed to start frontend: {e}[/]")
         time.sleep(3)
 
-def start_api_server():
-    """Start the FastAPI server."""
-    import subprocess
+def start_api_server(port: int = 8000):
+    """
+    Start the FastAPI server in this process.
+    uvicorn picks up uvloop/httptools automatically when installed (uvicorn[standard]).
+    """
+    import uvicorn
     console.print("\n[bold cyan]Starting ParseFin API Server...[/]")
-    console.print("[dim]Server will be available at: http://localhost:8000[/]")
-    console.print("[dim]API Documentation: http://localhost:8000/docs[/]")
+    console.print(f"[dim]Server will be available at: http://localhost:{port}[/]")
+    console.print(f"[dim]API Documentation: http://localhost:{port}/docs[/]")
     console.print("[dim]Press Ctrl+C to stop the server[/]\n")
 
     try:
-        subprocess.run(
-            [sys.executable, "-m", "uvicorn", "src.brokerage_parser.api:app", "--reload", "--port", "8000"],
-            cwd=Path(__file__).parent.parent.parent
-        )
+        uvicorn.run("brokerage_parser.api:app", host="127.0.0.1", port=port)
     except KeyboardInterrupt:
         console.print("\n[yellow]Server stopped.[/]")
     except Exception as e:
         console.print(f"\n[red]Failed to start server: {e}[/]")
-        console.print("[dim]Try running: uvicorn src.brokerage_parser.api:app --reload --port 8000[/]")
+        console.print(f"[dim]Try running: uvicorn brokerage_parser.api:app --reload --port {port}[/]")
         time.sleep(3)
 
 def run_wrapper(input_path_str: str):
@@ -803,7 +1086,7 @@ Examples:
   %(prog)s                                  Launch interactive menu
 """
 
-def main():
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="brokerage-parser",
         description=PROGRAM_DESCRIPTION,
@@ -851,6 +1134,11 @@ def main():
         action="store_true",
         help="Run with mock data for demonstration"
     )
+    parser.add_argument(
+        "--fast-mock",
+        action="store_true",
+        help="Skip the simulated parse delay in mock/demo mode (same as PARSEFIN_FAST_MOCK=1)"
+    )
     parser.add_argument(
         "--quiet", "-q",
         action="store_true",
@@ -866,36 +1154,43 @@ def main():
         action="store_true",
         help="Output results as newline-delimited JSON (streamable)"
     )
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent --json output even when stdout is not a terminal"
+    )
     parser.add_argument(
         "--version", "-v",
         action="version",
         version="%(prog)s 1.0.0"
     )
+    return parser
+
+# Built on the first main() call and reused after (tests, batch runners call main()
+# repeatedly); importing the module for its helpers never builds it
+_PARSER: Optional[argparse.ArgumentParser] = None
 
-    args = parser.parse_args()
+def _get_parser() -> argparse.ArgumentParser:
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
+def main():
+    args = _get_parser().parse_args()
+
+    if args.fast_mock:
+        # Via the environment so pool workers see it too
+        os.environ["PARSEFIN_FAST_MOCK"] = "1"
 
     if args.ui:
         start_frontend()
     elif args.serve:
-        # Start API server
-        import subprocess
-        console.print("[bold cyan]Starting ParseFin API Server...[/]")
-        console.print(f"[dim]Server: http://localhost:{args.port}[/]")
-        console.print(f"[dim]API Docs: http://localhost:{args.port}/docs[/]")
-        console.print("[dim]Press Ctrl+C to stop[/]\n")
-        try:
-            subprocess.run([
-                sys.executable, "-m", "uvicorn",
-                "src.brokerage_parser.api:app",
-                "--reload",
-                "--port", str(args.port)
-            ])
-        except KeyboardInterrupt:
-            console.print("\n[yellow]Server stopped.[/]")
+        start_api_server(args.port)
     elif args.mock:
         global USE_MOCK
         USE_MOCK = True
-        dummy = [Path(f"mock_stmt_{i}.pdf") for i in range(5)]
+        dummy = [f"mock_stmt_{i}.pdf" for i in range(5)]
         process_batch(dummy, args)
     elif args.input:
         run_wrapper(args.input)
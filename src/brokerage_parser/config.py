@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field
@@ -5,6 +6,8 @@ from pydantic import Field
 class Settings(BaseSettings):
     # App & Security
     ENV: str = "development"
+    # Keys the BLAKE2b hash of every API key secret (core/security.py). Changing it
+    # invalidates every key hashed with the old value: those keys must be reissued
     API_KEY_SALT: str = Field(..., description="Salt for hashing API keys")
     ADMIN_JWT_SECRET: str = Field(..., description="Secret key for Admin JWT signing")
     PORTAL_JWT_SECRET: Optional[str] = Field(None, description="Secret key for Portal JWT signing")
@@ -69,4 +72,14 @@ class Settings(BaseSettings):
 
     model_config = {"env_file": ".env", "extra": "ignore"}
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings, read from the environment on first call."""
+    return Settings()
+
+def __getattr__(name):
+    # `settings` is built on first access (PEP 562), so importing this module
+    # alone does not read the environment or run validators
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,23 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
 from fastapi import HTTPException
+import asyncio
+from functools import lru_cache
 import hashlib
-from typing import Optional
+import hmac
+import logging
+from typing import Optional, Tuple
 import time
+import redis
+from sqlalchemy import bindparam, select, update
 
-from brokerage_parser.db import SessionLocal
+from brokerage_parser.db import get_engine
 from brokerage_parser.models import ApiKey, TenantRateLimit
-from brokerage_parser.config import settings
+from brokerage_parser.config import get_settings
 from brokerage_parser.core.rate_limiter import RateLimiter
+from brokerage_parser.core.security import (
+    api_key_hash_is_legacy, hash_api_key_secret, verify_api_key_secret_async
+)
 
 # Initialize RateLimiter globally or per request? Globally is better for connection pooling.
 # But initialization might need settings which might be loaded.
@@ -22,15 +31,98 @@ def get_rate_limiter():
         _rate_limiter = RateLimiter()
     return _rate_limiter
 
+logger = logging.getLogger(__name__)
+
+# Paths neither middleware applies to: open endpoints, and the Admin/Portal APIs
+# that authenticate themselves. A tuple lets str.startswith test them all in one call.
+_BYPASS_PREFIXES = ("/health", "/metrics", "/docs", "/openapi.json", "/admin", "/portal")
+
+# Verified API keys, so repeat requests skip the DB lookup and bcrypt:
+# "apikey:{access_id}" -> "{sha256(secret)}|{tenant_id}|{org_id}", or the
+# tombstone below once the key is revoked
+API_KEY_CACHE_TTL = 300
+_REVOKED_TOMBSTONE = "revoked"
+
+@lru_cache(maxsize=1)
+def _dummy_api_key_hash() -> str:
+    # Verified against when the access id is unknown; it never authenticates (see dispatch).
+    # Built on first use: the hash key comes from settings
+    return hash_api_key_secret("")
+
+def get_api_key_cache() -> redis.Redis:
+    # Same client (and connection pool) as the rate limiter
+    return get_rate_limiter().redis
+
+def _get_cached_api_key(access_id: str, secret_digest: str) -> Optional[Tuple[str, str]]:
+    """(tenant_id, org_id) if this exact key was verified recently, else None."""
+    try:
+        cached = get_api_key_cache().get(f"apikey:{access_id}")
+    except redis.RedisError as e:
+        logger.error(f"Redis error reading API key cache: {e}")
+        return None
+    if not cached or cached == _REVOKED_TOMBSTONE:
+        return None
+    digest, tenant_id, org_id = cached.split("|")
+    if not hmac.compare_digest(digest, secret_digest):
+        return None
+    return tenant_id, org_id
+
+def _cache_api_key(access_id: str, secret_digest: str, tenant_id: str, org_id: str) -> None:
+    # NX: a request that loaded the row before a revoke must not overwrite the tombstone
+    try:
+        get_api_key_cache().set(
+            f"apikey:{access_id}", f"{secret_digest}|{tenant_id}|{org_id}",
+            nx=True, ex=API_KEY_CACHE_TTL,
+        )
+    except redis.RedisError as e:
+        logger.error(f"Redis error writing API key cache: {e}")
+
+def invalidate_api_key(access_id: str) -> None:
+    """Replace a key's cached verification with a tombstone. Call whenever a key is revoked.
+
+    The tombstone outlives any in-flight request that verified the key before the
+    revoke committed, so that request's cache write (NX) cannot resurrect it.
+    """
+    try:
+        get_api_key_cache().set(f"apikey:{access_id}", _REVOKED_TOMBSTONE, ex=API_KEY_CACHE_TTL)
+    except redis.RedisError as e:
+        # The entry still expires after API_KEY_CACHE_TTL
+        logger.error(f"Redis error invalidating API key cache: {e}")
+
+# Core statement, compiled once: no ORM identity map or unit of work per lookup
+_API_KEY_LOOKUP = select(
+    ApiKey.tenant_id, ApiKey.organization_id, ApiKey.secret_hash
+).where(ApiKey.access_key_id == bindparam("access_id"), ApiKey.is_active == True)
+
+def _fetch_api_key(access_id: str):
+    """The active key's (tenant_id, organization_id, secret_hash) row, or None."""
+    with get_engine().connect() as conn:
+        return conn.execute(_API_KEY_LOOKUP, {"access_id": access_id}).first()
+
+def _remember_api_key(access_id: str, secret_digest: str, tenant_id: str, org_id: str, secret: str, legacy: bool) -> None:
+    """Post-verification bookkeeping: cache the key and upgrade a bcrypt hash."""
+    _cache_api_key(access_id, secret_digest, tenant_id, org_id)
+    if legacy:
+        _upgrade_api_key_hash(access_id, secret)
+
+def _upgrade_api_key_hash(access_id: str, secret: str) -> None:
+    """Swap a verified key's bcrypt hash for the keyed BLAKE2b one."""
+    try:
+        with get_engine().begin() as conn:
+            conn.execute(
+                update(ApiKey)
+                .where(ApiKey.access_key_id == access_id)
+                .values(secret_hash=hash_api_key_secret(secret))
+            )
+    except Exception as e:
+        # The bcrypt hash still verifies; try again on the next cache miss
+        logger.error(f"Failed to upgrade API key hash: {e}")
+
 class TenantContextMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        # Allow health check and open endpoints
-        path = request.url.path
-        if any(path.startswith(p) for p in ["/health", "/metrics", "/docs", "/openapi.json"]):
-            return await call_next(request)
-
-        # Skip for Admin and Portal APIs (they handle their own auth)
-        if request.url.path.startswith("/admin") or request.url.path.startswith("/portal"):
+        settings = get_settings()
+        # Open endpoints, plus Admin and Portal APIs (they handle their own auth)
+        if request.url.path.startswith(_BYPASS_PREFIXES):
             return await call_next(request)
 
         # 1. Extract API Key
@@ -52,9 +144,6 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
                   # So we enforce it unless specifically testing.
                   pass
 
-             # Hash key
-             import bcrypt
-
              # Format: ak_{access_key_id}_{secret}
              if not api_key.startswith("ak_"):
                  if settings.ENABLE_TENANT_ISOLATION:
@@ -69,19 +158,30 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
                       return JSONResponse(status_code=401, content={"detail": "Invalid API Key format"})
                  return await call_next(request)
 
-             session = SessionLocal()
-             try:
-                 key_record = session.query(ApiKey).filter(ApiKey.access_key_id == access_id, ApiKey.is_active == True).first()
-                 if key_record:
-                     # Verify Secret
-                     if bcrypt.checkpw(secret.encode(), key_record.secret_hash.encode()):
-                         tenant_id = str(key_record.tenant_id)
-                         org_id = str(key_record.organization_id)
-                     else:
-                         if settings.ENABLE_TENANT_ISOLATION:
-                             return JSONResponse(status_code=401, content={"detail": "Invalid API Key"})
-             finally:
-                 session.close()
+             # Recently verified keys skip the DB lookup and bcrypt
+             secret_digest = hashlib.sha256(secret.encode()).hexdigest()
+             # Redis and DB calls are blocking, so they run on worker threads
+             # rather than stalling every other request on the event loop
+             cached = await asyncio.to_thread(_get_cached_api_key, access_id, secret_digest)
+             if cached:
+                 tenant_id, org_id = cached
+             else:
+                 # The connection goes back to the pool before the secret is verified
+                 key_record = await asyncio.to_thread(_fetch_api_key, access_id)
+                 # Unknown ids hash against a dummy, so a miss does the same work and
+                 # gets the same reply as a wrong secret (no key-enumeration oracle)
+                 secret_hash = key_record.secret_hash if key_record else _dummy_api_key_hash()
+                 # Verify Secret
+                 if await verify_api_key_secret_async(secret, secret_hash) and key_record:
+                     tenant_id = str(key_record.tenant_id)
+                     org_id = str(key_record.organization_id)
+                     await asyncio.to_thread(
+                         _remember_api_key, access_id, secret_digest, tenant_id, org_id,
+                         secret, api_key_hash_is_legacy(key_record.secret_hash)
+                     )
+                 else:
+                     if settings.ENABLE_TENANT_ISOLATION:
+                         return JSONResponse(status_code=401, content={"detail": "Invalid API Key"})
 
         # 3. Fallback for Development / Tests (Optional)
         if not tenant_id and not settings.ENABLE_TENANT_ISOLATION:
@@ -101,18 +201,15 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
+        settings = get_settings()
         if not settings.RATE_LIMIT_ENABLED:
             return await call_next(request)
 
-        # Skip for health/metrics/docs (same as Auth)
-        path = request.url.path
-        if any(path.startswith(p) for p in ["/health", "/metrics", "/docs", "/openapi.json"]):
-             return await call_next(request)
-
+        # Skip health/metrics/docs (same as Auth).
         # Admin/Portal logic? Plan says "Add rate limit middleware".
         # Assuming Admin is exempt or has different limits?
         # Let's skip Admin/Portal for now as they are internal-facing or have auth based sessions.
-        if request.url.path.startswith("/admin") or request.url.path.startswith("/portal"):
+        if request.url.path.startswith(_BYPASS_PREFIXES):
              return await call_next(request)
 
         # Get Tenant ID from state (set by TenantContextMiddleware)
@@ -144,9 +241,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         limit = default_limit
         # TODO: Lookup tenant-specific limits from DB/Redis
 
-        # Check Rate Limit
+        # Check and record in one atomic Redis call, on a worker thread (blocking client)
         limiter = get_rate_limiter()
-        allowed, remaining, reset_time = limiter.check_rate_limit(
+        allowed, remaining, reset_time = await asyncio.to_thread(
+            limiter.acquire,
             tenant_id,
             limit_type,
             limit,
@@ -176,9 +274,6 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # For long running jobs, worker finish.
         # This middleware only handles Request Rate Limits (Throttling). concurrency is separate.
 
-        # Record request
-        limiter.record_request(tenant_id, limit_type)
-
         response = await call_next(request)
 
         # Add headers to successful response
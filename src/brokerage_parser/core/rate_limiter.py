@@ -2,13 +2,39 @@ import time
 import logging
 from typing import Tuple, Optional
 import redis
-from brokerage_parser.config import settings
+from brokerage_parser.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Trim, count, conditionally add and expire in one server-side step, so a check
+# and its record are a single round trip and concurrent requests can't both
+# take the last slot. Returns {allowed, count_after, oldest_score or false}.
+_ACQUIRE_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+local count = redis.call('ZCARD', key)
+local allowed = 0
+if count < limit then
+    redis.call('ZADD', key, now, ARGV[4])
+    count = count + 1
+    allowed = 1
+end
+redis.call('EXPIRE', key, window + 60)
+local oldest = redis.call('ZRANGE', key, 0, 0, 'WITHSCORES')
+return {allowed, count, oldest[2] or false}
+"""
+
 class RateLimiter:
-    def __init__(self, redis_url: str = settings.REDIS_URL):
+    def __init__(self, redis_url: Optional[str] = None):
+        # Resolved per instance, so importing this module does not build Settings
+        if redis_url is None:
+            redis_url = get_settings().REDIS_URL
         self.redis = redis.from_url(redis_url, decode_responses=True)
+        # Script objects run via EVALSHA and reload themselves on NOSCRIPT
+        self._acquire_script = self.redis.register_script(_ACQUIRE_LUA)
 
     def _get_key(self, tenant_id: str, limit_type: str) -> str:
         return f"ratelimit:{tenant_id}:{limit_type}"
@@ -24,7 +50,7 @@ class RateLimiter:
         Checks if a request is allowed under the sliding window rate limit.
         Returns: (allowed: bool, remaining: int, reset_time: float)
         """
-        if not settings.RATE_LIMIT_ENABLED:
+        if not get_settings().RATE_LIMIT_ENABLED:
             return True, max_requests, 0.0
 
         key = self._get_key(tenant_id, limit_type)
@@ -57,17 +83,7 @@ class RateLimiter:
             else:
                 reset_timestamp = now + window_seconds if not allowed else now
 
-            # Record Metric
-            try:
-                from brokerage_parser.monitoring.metrics import RATE_LIMIT_HITS
-                result_label = "allowed" if allowed else "denied"
-                RATE_LIMIT_HITS.labels(
-                    tenant_id=tenant_id,
-                    limit_type=limit_type,
-                    result=result_label
-                ).inc()
-            except ImportError:
-                pass # Avoid circular imports if any, or test issues
+            self._record_metric(tenant_id, limit_type, allowed)
 
             return allowed, remaining, reset_timestamp
 
@@ -76,11 +92,64 @@ class RateLimiter:
             # Fail open for availability
             return True, 1, 0.0
 
+    def acquire(
+        self,
+        tenant_id: str,
+        limit_type: str,
+        max_requests: int,
+        window_seconds: int
+    ) -> Tuple[bool, int, float]:
+        """
+        Atomic check_rate_limit + record_request: the request is recorded only if
+        it is allowed. Returns: (allowed: bool, remaining: int, reset_time: float),
+        where remaining already counts this request.
+        """
+        if not get_settings().RATE_LIMIT_ENABLED:
+            return True, max_requests, 0.0
+
+        key = self._get_key(tenant_id, limit_type)
+        now = time.time()
+        member = f"{now}:{time.time_ns()}"
+
+        try:
+            allowed, count, oldest_score = self._acquire_script(
+                keys=[key], args=[now, window_seconds, max_requests, member]
+            )
+        except redis.RedisError as e:
+            logger.error(f"Redis error in rate limiter: {e}")
+            # Fail open for availability
+            return True, 1, 0.0
+
+        allowed = bool(allowed)
+        remaining = max(0, max_requests - count)
+
+        # Reset time: when the oldest request in the window expires
+        if oldest_score:
+            reset_timestamp = float(oldest_score) + window_seconds
+        else:
+            reset_timestamp = now + window_seconds if not allowed else now
+
+        self._record_metric(tenant_id, limit_type, allowed)
+
+        return allowed, remaining, reset_timestamp
+
+    def _record_metric(self, tenant_id: str, limit_type: str, allowed: bool) -> None:
+        try:
+            from brokerage_parser.monitoring.metrics import RATE_LIMIT_HITS
+            result_label = "allowed" if allowed else "denied"
+            RATE_LIMIT_HITS.labels(
+                tenant_id=tenant_id,
+                limit_type=limit_type,
+                result=result_label
+            ).inc()
+        except ImportError:
+            pass # Avoid circular imports if any, or test issues
+
     def record_request(self, tenant_id: str, limit_type: str) -> None:
         """
         Records a request in the sliding window.
         """
-        if not settings.RATE_LIMIT_ENABLED:
+        if not get_settings().RATE_LIMIT_ENABLED:
             return
 
         key = self._get_key(tenant_id, limit_type)
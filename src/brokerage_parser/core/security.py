@@ -1,9 +1,58 @@
+import asyncio
+import hashlib
+import hmac
+import os
+from functools import lru_cache
+import bcrypt
 from passlib.context import CryptContext
 
+from brokerage_parser.config import get_settings
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Caps concurrent bcrypt verifications so a login burst can't spawn a thread per request.
+_BCRYPT_SEM = asyncio.Semaphore(os.cpu_count() or 1)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Non-blocking variant of verify_password for async endpoints.
+    bcrypt is CPU-bound (~100ms), so it runs in a worker thread instead of the event loop.
+    """
+    async with _BCRYPT_SEM:
+        return await asyncio.to_thread(verify_password, plain_password, hashed_password)
+
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+# --- API key secrets ---
+# Secrets are 256-bit random tokens (secrets.token_urlsafe(32)), so a keyed BLAKE2b
+# digest is as hard to reverse as bcrypt; the work factor only matters for guessable
+# passwords. The prefix tells these hashes apart from older bcrypt rows.
+API_KEY_HASH_PREFIX = "b2$"
+
+@lru_cache(maxsize=1)
+def _api_key_hash_key() -> bytes:
+    # Read on first use, not at import. BLAKE2b keys are at most 64 bytes;
+    # longer salts are digested down first
+    key = get_settings().API_KEY_SALT.encode()
+    if len(key) > 64:
+        key = hashlib.blake2b(key).digest()
+    return key
+
+def hash_api_key_secret(secret: str) -> str:
+    digest = hashlib.blake2b(secret.encode(), key=_api_key_hash_key(), digest_size=32).hexdigest()
+    return API_KEY_HASH_PREFIX + digest
+
+def api_key_hash_is_legacy(secret_hash: str) -> bool:
+    """True for bcrypt hashes written before keyed BLAKE2b; rehash them on next use."""
+    return not secret_hash.startswith(API_KEY_HASH_PREFIX)
+
+async def verify_api_key_secret_async(secret: str, secret_hash: str) -> bool:
+    """Check an API key secret against either hash format; bcrypt goes to a thread."""
+    if api_key_hash_is_legacy(secret_hash):
+        async with _BCRYPT_SEM:
+            return await asyncio.to_thread(bcrypt.checkpw, secret.encode(), secret_hash.encode())
+    return hmac.compare_digest(hash_api_key_secret(secret), secret_hash)
@@ -1,22 +1,41 @@
 from datetime import datetime
+from functools import lru_cache
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
-from brokerage_parser.config import settings
+from brokerage_parser.config import get_settings
 
 # Database Setup
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_size=settings.SQLALCHEMY_POOL_SIZE,
-    max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
-    pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
-    pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
-)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# The engine is built on first use rather than at import, so importing the models
+# (e.g. from the CLI) does not need DATABASE_URL or any other setting
+@lru_cache(maxsize=1)
+def get_engine() -> Engine:
+    settings = get_settings()
+    return create_engine(
+        settings.DATABASE_URL,
+        pool_size=settings.SQLALCHEMY_POOL_SIZE,
+        max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+        pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+        pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+    )
+
+@lru_cache(maxsize=1)
+def get_sessionmaker() -> sessionmaker:
+    return sessionmaker(autocommit=False, autoflush=False, bind=get_engine())
+
 Base = declarative_base()
 
+def __getattr__(name):
+    # `engine` and `SessionLocal` stay importable by name (PEP 562)
+    if name == "engine":
+        return get_engine()
+    if name == "SessionLocal":
+        return get_sessionmaker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_db():
-    db = SessionLocal()
+    db = get_sessionmaker()()
     # TODO: Multi-tenancy Session Injection will happen here
     try:
         yield db
@@ -1,8 +1,14 @@
+import csv
 import json
 from pathlib import Path
 from typing import Dict, Any
 from brokerage_parser.models.domain import ParsedStatement
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 def to_json(statement: ParsedStatement, path: str) -> None:
     """
     Exports the ParsedStatement to a JSON file.
@@ -12,8 +18,13 @@ def to_json(statement: ParsedStatement, path: str) -> None:
         path: Destination file path.
     """
     data = statement.to_dict()
-    json_str = json.dumps(data, indent=2)
-    Path(path).write_text(json_str, encoding="utf-8")
+    if orjson is not None:
+        # Encoded straight to UTF-8 bytes in C, then written in one call
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    # Stream straight to the file rather than building the whole document as one string
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
 
 def to_csv(statement: ParsedStatement, path: str) -> None:
     """
@@ -23,18 +34,23 @@ def to_csv(statement: ParsedStatement, path: str) -> None:
         statement: The ParsedStatement object.
         path: Destination file path.
     """
-    import pandas as pd
+    # Plain csv module: avoids importing pandas (and numpy) just to dump rows
+    rows = [t.to_dict() for t in statement.transactions]
 
-    if not statement.transactions:
+    if rows:
+        # Optional keys (isin, fx_rate, ...) only appear on some rows; union them in first-seen order
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+    else:
         # Create empty CSV with headers if no transactions
-        pd.DataFrame(columns=[
+        fieldnames = [
             "date", "type", "description", "amount",
             "symbol", "quantity", "price"
-        ]).to_csv(path, index=False)
-        return
+        ]
 
-    df = pd.DataFrame([t.to_dict() for t in statement.transactions])
-    df.to_csv(path, index=False)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(rows)
 
 def to_dataframe(statement: ParsedStatement) -> Dict[str, Any]:
     """
@@ -4,12 +4,13 @@ import urllib.request
 import urllib.error
 from typing import Optional, Dict, Any
 
-from brokerage_parser.config import settings
+from brokerage_parser.config import get_settings
 
 logger = logging.getLogger(__name__)
 
 class LLMClient:
     def __init__(self):
+        settings = get_settings()
         self.base_url = settings.LLM_BASE_URL
         self.api_key = settings.LLM_API_KEY
         self.model = settings.LLM_MODEL
@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime, timezone
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UniqueConstraint, BigInteger, Text
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, UniqueConstraint, BigInteger, Text, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from brokerage_parser.db import Base
@@ -39,7 +39,7 @@ class ApiKey(Base):
 
     key_id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     access_key_id = Column(String(255), nullable=False, index=True, unique=True)
-    secret_hash = Column(String(255), nullable=False) # Bcrypt hash
+    secret_hash = Column(String(255), nullable=False) # Keyed BLAKE2b ("b2$...") or legacy bcrypt
     tenant_id = Column(UUID(as_uuid=True), ForeignKey("tenants.tenant_id", ondelete="CASCADE", onupdate="CASCADE"), nullable=False, index=True)
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.organization_id", ondelete="RESTRICT", onupdate="CASCADE"), nullable=False) # Redundant but useful for quick RLS
     name = Column(String(255), nullable=True)
@@ -74,4 +74,9 @@ class AdminAuditLog(Base):
     ip_address = Column(String(45), nullable=True)
     timestamp = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), index=True)
 
+    __table_args__ = (
+        # Backs keyset pagination of the audit log (ORDER BY timestamp DESC, id DESC)
+        Index('ix_admin_audit_log_timestamp_id', timestamp.desc(), id.desc()),
+    )
+
     # Immutability is enforced by DB REVOKE, but helpful to note here
@@ -14,7 +14,6 @@ from brokerage_parser.extraction.spatial import find_value_in_region, find_text_
 from brokerage_parser.models import ExtractionMethod
 from brokerage_parser.models.domain import SourceReference, ParsedStatement
 from brokerage_parser.extraction import RichPage, RichTable, TableData
-from brokerage_parser.config import settings
 
 
 
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from brokerage_parser.db import SessionLocal
 from brokerage_parser.models.tenant import Organization, Tenant, ApiKey
 from brokerage_parser.models.provisioning import ProvisioningRequest, ProvisioningStatus, PendingNotification
-from brokerage_parser.core.security import get_password_hash
+from brokerage_parser.core.security import hash_api_key_secret
 from brokerage_parser.notifications.email import send_welcome_email
 from sqlalchemy import text
 
@@ -88,7 +88,7 @@ class ProvisioningWorkflow:
             # 4. Create Initial API Key
             access_key_id = f"pk_{secrets.token_hex(8)}"
             secret_key = secrets.token_urlsafe(32)
-            secret_hash = get_password_hash(secret_key)
+            secret_hash = hash_api_key_secret(secret_key)
 
             api_key = ApiKey(
                 access_key_id=access_key_id,
@@ -1,10 +1,11 @@
+import asyncio
 import uuid
 import secrets
 from datetime import datetime, timezone, date
 from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Body
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, tuple_, insert, select, literal
 from pydantic import BaseModel, EmailStr, Field
 
 from brokerage_parser.db import get_db
@@ -12,7 +13,8 @@ from brokerage_parser.models.tenant import Organization, Tenant, ApiKey, AdminAu
 from brokerage_parser.auth.admin import get_current_admin, AdminUser
 from brokerage_parser.core.audit import create_audit_log
 from brokerage_parser.core.audit import create_audit_log
-from brokerage_parser.core.security import get_password_hash
+from brokerage_parser.core.security import hash_api_key_secret
+from brokerage_parser.core.middleware import invalidate_api_key
 from brokerage_parser.core.rate_limiter import RateLimiter
 from brokerage_parser.models import TenantRateLimit, UsageRecord
 from brokerage_parser.models.provisioning import ProvisioningRequest, ProvisioningStatus
@@ -220,31 +222,41 @@ async def create_api_key(
     db: Session = Depends(get_db),
     admin: AdminUser = Depends(get_current_admin)
 ):
-    tenant = db.query(Tenant).get(tenant_id)
-    if not tenant:
-        raise HTTPException(status_code=404, detail="Tenant not found")
-
     # Generate Keys
     # access_key_id: prefix "pk_" + random
     access_key_id = f"pk_{secrets.token_hex(8)}"
     secret_key = secrets.token_urlsafe(32)
-    secret_hash = get_password_hash(secret_key)
-
-    api_key = ApiKey(
-        access_key_id=access_key_id,
-        secret_hash=secret_hash,
-        tenant_id=tenant_id,
-        organization_id=tenant.organization_id,
-        name=key_in.name,
-        is_active=True
+    secret_hash = hash_api_key_secret(secret_key)
+
+    # Single INSERT ... SELECT ... RETURNING: the tenant's organization_id is
+    # resolved inside the insert, so no separate SELECT round-trip is needed.
+    # No row back means the tenant does not exist.
+    stmt = (
+        insert(ApiKey)
+        .from_select(
+            ["access_key_id", "secret_hash", "tenant_id", "organization_id", "name", "is_active"],
+            select(
+                literal(access_key_id),
+                literal(secret_hash),
+                Tenant.tenant_id,
+                Tenant.organization_id,
+                literal(key_in.name),
+                literal(True)
+            ).where(Tenant.tenant_id == tenant_id)
+        )
+        .returning(
+            ApiKey.key_id, ApiKey.access_key_id, ApiKey.name,
+            ApiKey.is_active, ApiKey.created_at, ApiKey.last_used_at
+        )
     )
-    db.add(api_key)
-    db.commit()
-    db.refresh(api_key)
+    api_key = db.execute(stmt).first()
+    if api_key is None:
+        raise HTTPException(status_code=404, detail="Tenant not found")
 
+    # Commits the key and its audit entry together
     create_audit_log(
         db, admin.email, "KEY_CREATE", request.client.host,
-        resource_id=str(api_key.key_id), tenant_id=str(tenant.tenant_id),
+        resource_id=str(api_key.key_id), tenant_id=str(tenant_id),
         reason=key_in.reason
     )
 
@@ -274,6 +286,7 @@ async def revoke_api_key(
 
     key.is_active = False
     db.commit()
+    await asyncio.to_thread(invalidate_api_key, key.access_key_id)
 
     create_audit_log(
         db, admin.email, "KEY_REVOKE", request.client.host,
@@ -288,18 +301,26 @@ async def revoke_api_key(
 async def list_audit_logs(
     admin_user: Optional[str] = None,
     action: Optional[str] = None,
-    skip: int = 0,
+    after_ts: Optional[datetime] = Query(None, description="Cursor: timestamp of the last entry on the previous page"),
+    after_id: Optional[int] = Query(None, description="Cursor: id of the last entry on the previous page"),
     limit: int = 100,
     db: Session = Depends(get_db),
     admin: AdminUser = Depends(get_current_admin)
 ):
-    query = db.query(AdminAuditLog).order_by(desc(AdminAuditLog.timestamp))
+    # Keyset pagination on (timestamp, id): the audit log is append-only and
+    # grows forever, so OFFSET would scan and discard every earlier row.
+    if (after_ts is None) != (after_id is None):
+        # Half a cursor would silently return page 1 again and loop the client
+        raise HTTPException(status_code=422, detail="after_ts and after_id must be sent together")
+    query = db.query(AdminAuditLog).order_by(desc(AdminAuditLog.timestamp), desc(AdminAuditLog.id))
     if admin_user:
         query = query.filter(AdminAuditLog.admin_user_id == admin_user)
     if action:
         query = query.filter(AdminAuditLog.action == action)
+    if after_ts is not None:
+        query = query.filter(tuple_(AdminAuditLog.timestamp, AdminAuditLog.id) < (after_ts, after_id))
 
-    return query.offset(skip).limit(limit).all()
+    return query.limit(limit).all()
 
 # 5. Health
 
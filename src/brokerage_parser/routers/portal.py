@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import uuid
 from typing import List, Optional
@@ -11,7 +12,8 @@ from brokerage_parser.db import get_db
 from brokerage_parser.auth.portal import get_current_tenant, PortalUser
 from brokerage_parser.models.tenant import Organization, Tenant, ApiKey, AdminAuditLog
 from brokerage_parser.models.job import Job, JobStatus
-from brokerage_parser.core.security import get_password_hash
+from brokerage_parser.core.security import hash_api_key_secret
+from brokerage_parser.core.middleware import invalidate_api_key
 from brokerage_parser.config import settings
 from brokerage_parser.models import TenantRateLimit, UsageEvent, UsageRecord, UsageEventType
 import secrets
@@ -109,7 +111,7 @@ async def create_key(
     # Generate Key
     access_key_id = f"pk_{secrets.token_hex(8)}"
     secret_key = secrets.token_urlsafe(32)
-    secret_hash = get_password_hash(secret_key)
+    secret_hash = hash_api_key_secret(secret_key)
 
     api_key = ApiKey(
         access_key_id=access_key_id,
@@ -143,6 +145,7 @@ async def revoke_key(
 
     key.is_active = False
     db.commit()
+    await asyncio.to_thread(invalidate_api_key, key.access_key_id)
     return None
 
 @router.get("/rate-limits", response_model=PortalRateLimitResponse)
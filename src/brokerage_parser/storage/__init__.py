@@ -1,7 +1,7 @@
 import hashlib
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, BinaryIO
-from brokerage_parser.config import settings
+from brokerage_parser.config import get_settings
 from brokerage_parser.storage.base import StorageBackend
 
 _backend: Optional[StorageBackend] = None
@@ -11,7 +11,7 @@ def get_backend() -> StorageBackend:
     if _backend:
         return _backend
 
-    if settings.STORAGE_BACKEND == "s3":
+    if get_settings().STORAGE_BACKEND == "s3":
         from brokerage_parser.storage.s3 import S3Storage
         _backend = S3Storage()
     else:
@@ -71,7 +71,7 @@ def get_document_path(doc_id: str) -> Optional[Path]:
     Current usage in API: get_document_content uses this to return FileResponse.
     """
     backend = get_backend()
-    if settings.STORAGE_BACKEND == "local":
+    if get_settings().STORAGE_BACKEND == "local":
         # Local backend implementation of get_document_url returns path string?
         # Actually local.get_document returns file obj.
         # We need to peek into backend or change API to use get_document stream.
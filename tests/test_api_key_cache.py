@@ -0,0 +1,64 @@
+import hashlib
+import pytest
+from unittest.mock import MagicMock, patch
+import redis
+
+from brokerage_parser.core.middleware import (
+    API_KEY_CACHE_TTL,
+    _cache_api_key,
+    _get_cached_api_key,
+    invalidate_api_key,
+)
+
+SECRET_DIGEST = hashlib.sha256(b"s3cret").hexdigest()
+
+@pytest.fixture
+def mock_redis():
+    with patch('brokerage_parser.core.middleware.get_api_key_cache') as mock_get_cache:
+        mock_client = MagicMock()
+        mock_get_cache.return_value = mock_client
+        yield mock_client
+
+def test_cache_hit(mock_redis):
+    mock_redis.get.return_value = f"{SECRET_DIGEST}|tenant1|org1"
+
+    assert _get_cached_api_key("abc", SECRET_DIGEST) == ("tenant1", "org1")
+    mock_redis.get.assert_called_once_with("apikey:abc")
+
+def test_cache_wrong_secret_is_miss(mock_redis):
+    mock_redis.get.return_value = f"{SECRET_DIGEST}|tenant1|org1"
+    other = hashlib.sha256(b"guess").hexdigest()
+
+    assert _get_cached_api_key("abc", other) is None
+
+def test_cache_empty_is_miss(mock_redis):
+    mock_redis.get.return_value = None
+
+    assert _get_cached_api_key("abc", SECRET_DIGEST) is None
+
+def test_invalidate_writes_tombstone(mock_redis):
+    invalidate_api_key("abc")
+
+    mock_redis.set.assert_called_once_with("apikey:abc", "revoked", ex=API_KEY_CACHE_TTL)
+
+def test_tombstone_is_miss(mock_redis):
+    mock_redis.get.return_value = "revoked"
+
+    assert _get_cached_api_key("abc", SECRET_DIGEST) is None
+
+def test_cache_write_never_overwrites(mock_redis):
+    # A request that verified the key before a revoke must not replace the tombstone
+    _cache_api_key("abc", SECRET_DIGEST, "tenant1", "org1")
+
+    mock_redis.set.assert_called_once_with(
+        "apikey:abc", f"{SECRET_DIGEST}|tenant1|org1", nx=True, ex=API_KEY_CACHE_TTL
+    )
+
+def test_redis_down_fails_open(mock_redis):
+    mock_redis.get.side_effect = redis.ConnectionError("down")
+    mock_redis.set.side_effect = redis.ConnectionError("down")
+
+    # Reads fall through to the DB; writes and invalidation are best effort
+    assert _get_cached_api_key("abc", SECRET_DIGEST) is None
+    _cache_api_key("abc", SECRET_DIGEST, "tenant1", "org1")
+    invalidate_api_key("abc")
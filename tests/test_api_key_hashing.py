@@ -0,0 +1,94 @@
+import asyncio
+import hashlib
+import uuid
+import bcrypt
+import pytest
+from unittest.mock import patch
+from sqlalchemy import create_engine
+
+from brokerage_parser.core import security
+from brokerage_parser.core.security import (
+    API_KEY_HASH_PREFIX,
+    api_key_hash_is_legacy,
+    hash_api_key_secret,
+    verify_api_key_secret_async,
+)
+from brokerage_parser.core.middleware import _fetch_api_key, _upgrade_api_key_hash
+from brokerage_parser.models.tenant import ApiKey
+
+def verify(secret, secret_hash):
+    return asyncio.run(verify_api_key_secret_async(secret, secret_hash))
+
+def legacy_hash(secret):
+    return bcrypt.hashpw(secret.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+def test_b2_hash_accepts_matching_secret():
+    secret_hash = hash_api_key_secret("s3cret")
+
+    assert secret_hash.startswith(API_KEY_HASH_PREFIX)
+    assert verify("s3cret", secret_hash) is True
+
+def test_b2_hash_rejects_wrong_secret():
+    assert verify("guess", hash_api_key_secret("s3cret")) is False
+
+def test_legacy_bcrypt_hash_verifies():
+    secret_hash = legacy_hash("s3cret")
+
+    assert verify("s3cret", secret_hash) is True
+    assert verify("guess", secret_hash) is False
+
+def test_api_key_hash_is_legacy():
+    assert api_key_hash_is_legacy(legacy_hash("s3cret")) is True
+    assert api_key_hash_is_legacy(hash_api_key_secret("s3cret")) is False
+
+@pytest.fixture
+def api_key_salt():
+    """Swap API_KEY_SALT for one test; the derived key is cached, so clear it around it."""
+    def set_salt(salt):
+        security._api_key_hash_key.cache_clear()
+        patcher = patch.object(security.get_settings(), "API_KEY_SALT", salt)
+        patcher.start()
+        patchers.append(patcher)
+    patchers = []
+    yield set_salt
+    for patcher in patchers:
+        patcher.stop()
+    security._api_key_hash_key.cache_clear()
+
+def test_long_salt_is_digested(api_key_salt):
+    salt = "s" * 100
+    api_key_salt(salt)
+
+    # BLAKE2b rejects keys over 64 bytes, so the salt is digested down first
+    expected = hashlib.blake2b(b"s3cret", key=hashlib.blake2b(salt.encode()).digest(), digest_size=32)
+    assert hash_api_key_secret("s3cret") == API_KEY_HASH_PREFIX + expected.hexdigest()
+
+def test_changing_salt_changes_hash(api_key_salt):
+    api_key_salt("first")
+    first = hash_api_key_secret("s3cret")
+    api_key_salt("second")
+
+    assert verify("s3cret", first) is False
+
+@pytest.fixture
+def api_key_engine(tmp_path):
+    """A file-backed SQLite api_keys table, standing in for the app engine."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'keys.db'}")
+    ApiKey.__table__.create(engine)
+    with patch("brokerage_parser.core.middleware.get_engine", return_value=engine):
+        yield engine
+    engine.dispose()
+
+def test_upgrade_rewrites_hash_and_key_still_authenticates(api_key_engine):
+    with api_key_engine.begin() as conn:
+        conn.execute(ApiKey.__table__.insert().values(
+            key_id=uuid.uuid4(), access_key_id="abc", secret_hash=legacy_hash("s3cret"),
+            tenant_id=uuid.uuid4(), organization_id=uuid.uuid4(), is_active=True,
+        ))
+
+    _upgrade_api_key_hash("abc", "s3cret")
+
+    row = _fetch_api_key("abc")
+    assert not api_key_hash_is_legacy(row.secret_hash)
+    assert verify("s3cret", row.secret_hash) is True
+    assert verify("guess", row.secret_hash) is False
@@ -1,10 +1,13 @@
+import io
+import json
 import pytest
 from decimal import Decimal
 from datetime import date
 from brokerage_parser.models import TransactionType, TaxWrapper
 from brokerage_parser.models.domain import Transaction
 from brokerage_parser.cgt.engine import CGTEngine
-from brokerage_parser.cgt.models import MatchType
+from brokerage_parser.cgt.models import MatchType, MatchEvent, CGTReport
+from brokerage_parser.cgt.pool import Section104Pool
 
 class TestCGTEngine:
 
@@ -126,6 +129,47 @@ class TestCGTEngine:
         # Allowable cost should be from Buy A (1000)
         assert e2.allowable_cost == Decimal("1000")
 
+    def test_same_day_takes_priority_over_bnb(self):
+        """
+        T1: Buy 100 (Pool)
+        T2: Sell 100
+        T3: Buy 100 + Sell 100 on the same day, 5 days later.
+        T3's Buy must match its Same Day Sell, not the earlier Sell via BnB.
+        """
+        txs = [
+            self.mk_tx("2023-01-01", TransactionType.BUY, 100, "-1000", "pool_buy"),
+            self.mk_tx("2023-02-01", TransactionType.SELL, 100, "1500", "early_sell"),
+            self.mk_tx("2023-02-06", TransactionType.BUY, 100, "-1200", "sd_buy"),
+            self.mk_tx("2023-02-06", TransactionType.SELL, 100, "1300", "sd_sell"),
+        ]
+
+        engine = CGTEngine()
+        report = engine.calculate(txs)
+
+        by_sell = {e.sell_transaction_id: e for e in report.match_events}
+        assert by_sell["sd_sell"].match_type == MatchType.SAME_DAY
+        assert by_sell["sd_sell"].buy_transaction_id == "sd_buy"
+        assert by_sell["early_sell"].match_type == MatchType.SECTION_104
+        assert by_sell["early_sell"].allowable_cost == Decimal("1000")
+
+    def test_bnb_window_expires_after_30_days(self):
+        """
+        A Buy 31 days after the Sell is outside the B&B window; the Sell uses the Pool.
+        """
+        txs = [
+            self.mk_tx("2023-01-01", TransactionType.BUY, 100, "-1000", "pool_buy"),
+            self.mk_tx("2023-02-01", TransactionType.SELL, 100, "1500", "sell"),
+            self.mk_tx("2023-03-04", TransactionType.BUY, 100, "-1200", "late_buy"),
+        ]
+
+        engine = CGTEngine()
+        report = engine.calculate(txs)
+
+        assert len(report.match_events) == 1
+        event = report.match_events[0]
+        assert event.match_type == MatchType.SECTION_104
+        assert event.allowable_cost == Decimal("1000")
+
     def test_isa_filtering(self):
         """
         Ensure ISA transactions are ignored.
@@ -141,3 +185,93 @@ class TestCGTEngine:
         report = engine.calculate(txs)
 
         assert len(report.match_events) == 0
+
+
+class TestSection104Pool:
+
+    def test_remove_in_parts_conserves_cost(self):
+        """
+        Removing a pool in uneven lots allocates exactly the pooled cost, no more, no less.
+        """
+        pool = Section104Pool()
+        pool.add(Decimal("3"), Decimal("100"))
+
+        costs = [pool.remove(Decimal("1")) for _ in range(3)]
+
+        assert sum(costs) == Decimal("100")
+        assert pool.total_quantity == 0
+        assert pool.total_cost == 0
+
+    def test_adjust_quantity_whole_and_fractional_ratios(self):
+        """Integer split ratios and fractional ones both scale quantity and keep cost."""
+        pool = Section104Pool()
+        pool.add(Decimal("10.5"), Decimal("210"))
+
+        assert pool.adjust_quantity(Decimal("2")) == (Decimal("10.5"), Decimal("21"))
+        assert pool.adjust_quantity(Decimal("0.5")) == (Decimal("21"), Decimal("10.5"))
+        assert pool.total_cost == Decimal("210")
+
+    def test_sub_unit_amounts_round_half_even(self):
+        """Costs are held to 4dp: digits beyond that round half-even, not toward zero."""
+        pool = Section104Pool()
+        pool.add(Decimal("1"), Decimal("0.00005"))   # 0.5 units -> 0
+        assert pool.total_cost == Decimal("0")
+        pool.add(Decimal("1"), Decimal("0.00015"))   # 1.5 units -> 2
+        assert pool.total_cost == Decimal("0.0002")
+        pool.add(Decimal("1"), Decimal("0.00016"))   # 1.6 units -> 2
+        assert pool.total_cost == Decimal("0.0004")
+
+    def test_partial_disposal_cost_rounds_half_even(self):
+        """A partial disposal's share of cost is rounded, not floored."""
+        pool = Section104Pool()
+        pool.add(Decimal("3"), Decimal("0.0002"))
+        # 1/3 of 2 units = 0.67 -> 1 (floor would give 0)
+        assert pool.remove(Decimal("1")) == Decimal("0.0001")
+
+        pool = Section104Pool()
+        pool.add(Decimal("2"), Decimal("0.0007"))
+        # 1/2 of 7 units = 3.5 -> 4 (even)
+        assert pool.remove(Decimal("1")) == Decimal("0.0004")
+        assert pool.total_cost == Decimal("0.0003")
+
+
+class TestCGTReport:
+
+    def mk_event(self, gain, proceeds="100", cost="100"):
+        return MatchEvent(
+            sell_transaction_id="s",
+            match_type=MatchType.SECTION_104,
+            quantity=Decimal("1"),
+            proceeds=Decimal(proceeds),
+            allowable_cost=Decimal(cost),
+            gain_gbp=Decimal(gain),
+        )
+
+    def test_totals_refresh_after_new_events(self):
+        """Totals are aggregated lazily and must reflect events added after a read."""
+        report = CGTReport(tax_year="2023/2024")
+        report.add_event(self.mk_event("50"))
+        assert report.total_gains == Decimal("50")
+
+        report.add_event(self.mk_event("-20"))
+
+        assert report.total_gains == Decimal("50")
+        assert report.total_losses == Decimal("-20")
+        assert report.net_gain == Decimal("30")
+        assert report.total_proceeds == Decimal("200")
+        assert report.to_dict()["net_gain"] == "30.00"
+
+    def test_write_json_matches_to_dict(self):
+        """The streamed JSON parses to exactly what to_dict() returns, including escaping."""
+        report = CGTReport(tax_year="2023/2024")
+        report.add_event(self.mk_event("50"))
+        event = self.mk_event("-20")
+        event.sell_transaction_id = 'id "quoted"'
+        event.buy_transaction_id = "b1"
+        event.date = "2023-05-01"
+        report.add_event(event)
+
+        buf = io.StringIO()
+        report.write_json(buf)
+
+        assert json.loads(buf.getvalue()) == report.to_dict()
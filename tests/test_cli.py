@@ -65,6 +65,25 @@ class TestFindPdfFiles:
 
         assert [f.name for f in result] == ["a.pdf", "m.pdf", "z.pdf"]
 
+    def test_find_pdfs_ignores_case_and_subdirectories(self, tmp_path):
+        """Upper-case extensions match; directories named *.pdf do not."""
+        (tmp_path / "a.PDF").touch()
+        (tmp_path / "b.pdf").touch()
+        (tmp_path / "folder.pdf").mkdir()
+
+        result = find_pdf_files(tmp_path)
+
+        assert [f.name for f in result] == ["a.PDF", "b.pdf"]
+
+    def test_find_pdfs_rescans_changed_directory(self, tmp_path):
+        """Repeat scans reflect files added since the last call."""
+        (tmp_path / "a.pdf").touch()
+        assert [f.name for f in find_pdf_files(tmp_path)] == ["a.pdf"]
+
+        (tmp_path / "b.pdf").touch()
+
+        assert [f.name for f in find_pdf_files(tmp_path)] == ["a.pdf", "b.pdf"]
+
     def test_empty_directory(self, tmp_path):
         """Empty directory returns empty list."""
         result = find_pdf_files(tmp_path)
@@ -131,6 +150,21 @@ class TestCLIIntegration:
         output = result.stdout or result.stderr
         assert "No PDF files found" in output
 
+    def test_import_without_settings(self, tmp_path):
+        """Importing the CLI does not build Settings, so no env vars are needed."""
+        src = str(Path(__file__).resolve().parent.parent / "src")
+        env = {"PATH": os.environ.get("PATH", ""), "PYTHONPATH": src, "PYTHONUTF8": "1"}
+        # tmp_path as cwd, so no .env file is picked up either
+        result = subprocess.run(
+            [sys.executable, "-c", "import brokerage_parser.cli"],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=tmp_path,
+        )
+
+        assert result.returncode == 0, result.stderr
+
 class TestCLIFeatures:
     """Tests for new CLI features (Settings, Frontend, Export)."""
 
@@ -195,6 +229,37 @@ class TestCLIFeatures:
         assert args[0] == mock_stmt
         assert str(args[1]).endswith(".md")
 
+    @patch('brokerage_parser.cli.os.cpu_count', return_value=1)
+    @patch('brokerage_parser.cli.export_statement')
+    @patch('brokerage_parser.cli.process_wrapper')
+    def test_export_failure_fails_only_that_file(self, mock_process, mock_export, _cpu, tmp_path):
+        """An exporter error marks its file as failed; the rest of the batch is still reported."""
+        mock_stmt = MagicMock(spec=ParsedStatement)
+        mock_stmt.broker = "TestBroker"
+        mock_stmt.account = "1234"
+        mock_stmt.transactions = []
+        mock_stmt.parse_errors = []
+        mock_process.return_value = mock_stmt
+
+        def export(statement, pdf, target):
+            if os.path.basename(pdf) == "b.pdf":
+                raise OSError("disk full")
+        mock_export.side_effect = export
+
+        pdf_files = [tmp_path / name for name in ("a.pdf", "b.pdf", "c.pdf")]
+        results = process_batch_plain(
+            pdf_files,
+            MagicMock(json=False, ndjson=False, quiet=True),
+            include_sources=False,
+            output_format="json",
+            output_dir=str(tmp_path / "out")
+        )
+
+        assert [(r["file"], r["status"]) for r in results] == [
+            ("a.pdf", "success"), ("b.pdf", "error"), ("c.pdf", "success")
+        ]
+        assert results[1]["error"] == "disk full"
+
     @patch('brokerage_parser.cli.start_frontend')
     @patch('brokerage_parser.cli.process_batch')
     def test_run_demo_mode(self, mock_process_batch, mock_start_frontend):
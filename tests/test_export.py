@@ -0,0 +1,61 @@
+import csv
+import json
+import pytest
+from decimal import Decimal
+from datetime import date
+from brokerage_parser import export
+from brokerage_parser.models import TransactionType
+from brokerage_parser.models.domain import ParsedStatement, Transaction, AccountSummary
+
+@pytest.fixture
+def statement():
+    return ParsedStatement(
+        broker="TestBroker",
+        statement_date=date(2024, 4, 6),
+        period_start=date(2023, 4, 6),
+        period_end=date(2024, 4, 5),
+        account=AccountSummary(account_number="123456", account_type="Individual"),
+        positions=[],
+        transactions=[]
+    )
+
+def test_to_csv_unions_optional_columns(statement, tmp_path):
+    """Columns that only some transactions have are still written, blank elsewhere."""
+    statement.transactions = [
+        Transaction(date=date(2024, 1, 2), type=TransactionType.BUY, description="Buy",
+                    amount=Decimal("-100"), symbol="AAPL", quantity=Decimal("1"), price=Decimal("100")),
+        Transaction(date=date(2024, 1, 3), type=TransactionType.DIVIDEND, description="Div",
+                    amount=Decimal("5"), isin="US0378331005"),
+    ]
+    out = tmp_path / "out.csv"
+
+    export.to_csv(statement, str(out))
+
+    with open(out, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0].keys()) == ["date", "type", "description", "amount", "symbol", "quantity", "price", "isin"]
+    assert rows[0]["isin"] == ""
+    assert rows[1]["isin"] == "US0378331005"
+    assert rows[1]["amount"] == "5"
+
+def test_to_csv_empty_writes_header(statement, tmp_path):
+    out = tmp_path / "out.csv"
+
+    export.to_csv(statement, str(out))
+
+    assert out.read_text().strip() == "date,type,description,amount,symbol,quantity,price"
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_to_json_round_trips_to_dict(statement, tmp_path, monkeypatch, use_orjson):
+    """Same document with or without orjson installed."""
+    if not use_orjson:
+        monkeypatch.setattr(export, "orjson", None)
+    statement.transactions = [
+        Transaction(date=date(2024, 1, 2), type=TransactionType.BUY, description="Achat société",
+                    amount=Decimal("-100.50"), symbol="AAPL", quantity=Decimal("1"), price=Decimal("100.50")),
+    ]
+    out = tmp_path / "out.json"
+
+    export.to_json(statement, str(out))
+
+    assert json.loads(out.read_text(encoding="utf-8")) == statement.to_dict()
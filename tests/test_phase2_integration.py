@@ -82,3 +82,20 @@ def test_full_provisioning_flow(db_session):
 
     # Cleanup overrides
     app.dependency_overrides = {}
+
+@pytest.mark.parametrize("cursor", ["after_ts=2024-01-01T00:00:00Z", "after_id=42"])
+def test_audit_log_rejects_half_cursor(cursor):
+    from fastapi import FastAPI
+    from brokerage_parser.auth.admin import get_current_admin
+    from brokerage_parser.models.admin import AdminUser
+    from brokerage_parser.routers.admin import router as admin_router
+
+    # Just the Admin API, so the check runs without the app's middleware stack
+    admin_app = FastAPI()
+    admin_app.include_router(admin_router)
+    admin_app.dependency_overrides[get_current_admin] = lambda: AdminUser(email="superadmin@example.com", role="superadmin", is_active=True)
+
+    response = TestClient(admin_app).get(f"/admin/audit-log?{cursor}")
+
+    # Half a cursor must not silently return page 1 again
+    assert response.status_code == 422
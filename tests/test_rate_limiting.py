@@ -74,3 +74,37 @@ def test_fail_open_on_redis_error(rate_limiter, mock_redis):
     # Should fail open
     assert allowed is True
     assert remaining == 1
+
+def test_acquire_allowed_counts_this_request(rate_limiter, mock_redis):
+    client, _ = mock_redis
+    script = client.register_script.return_value
+    # Script reply: allowed, count after adding, oldest score
+    script.return_value = [1, 6, "1234567890.0"]
+
+    allowed, remaining, reset = rate_limiter.acquire("tenant1", "jobs", 10, 3600)
+
+    assert allowed is True
+    assert remaining == 4 # 10 - 6
+    assert reset == 1234567890.0 + 3600
+    assert script.call_args.kwargs["keys"] == ["ratelimit:tenant1:jobs"]
+    # One atomic call: no separate pipeline or ZADD
+    assert not client.pipeline.called
+    assert not client.zadd.called
+
+def test_acquire_exceeded(rate_limiter, mock_redis):
+    client, _ = mock_redis
+    client.register_script.return_value.return_value = [0, 10, "1234567890.0"]
+
+    allowed, remaining, reset = rate_limiter.acquire("tenant1", "jobs", 10, 3600)
+
+    assert allowed is False
+    assert remaining == 0
+
+def test_acquire_fails_open_on_redis_error(rate_limiter, mock_redis):
+    client, _ = mock_redis
+    client.register_script.return_value.side_effect = redis.RedisError("Redis connection failed")
+
+    allowed, remaining, reset = rate_limiter.acquire("tenant1", "jobs", 10, 3600)
+
+    assert allowed is True
+    assert remaining == 1
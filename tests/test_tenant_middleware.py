@@ -0,0 +1,85 @@
+import os
+import subprocess
+import sys
+import uuid
+import bcrypt
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from brokerage_parser.config import get_settings
+from brokerage_parser.core.middleware import TenantContextMiddleware
+from brokerage_parser.core.security import hash_api_key_secret
+
+TENANT_ID = uuid.uuid4()
+ORG_ID = uuid.uuid4()
+
+def key_row(secret_hash):
+    return SimpleNamespace(tenant_id=TENANT_ID, organization_id=ORG_ID, secret_hash=secret_hash)
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(TenantContextMiddleware)
+
+    @app.get("/whoami")
+    def whoami(request: Request):
+        return {"tenant_id": request.state.tenant_id, "org_id": request.state.org_id}
+
+    with patch.object(get_settings(), "ENABLE_TENANT_ISOLATION", True), \
+         patch("brokerage_parser.core.middleware._get_cached_api_key", return_value=None), \
+         patch("brokerage_parser.core.middleware._cache_api_key"):
+        yield TestClient(app)
+
+def test_unknown_access_id_is_invalid_key(client):
+    with patch("brokerage_parser.core.middleware._fetch_api_key", return_value=None):
+        response = client.get("/whoami", headers={"X-API-Key": "ak_nope_s3cret"})
+
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid API Key"}
+
+def test_wrong_secret_is_invalid_key(client):
+    row = key_row(hash_api_key_secret("s3cret"))
+    with patch("brokerage_parser.core.middleware._fetch_api_key", return_value=row):
+        response = client.get("/whoami", headers={"X-API-Key": "ak_abc_guess"})
+
+    # Same reply as an unknown id, so ids cannot be enumerated
+    assert response.status_code == 401
+    assert response.json() == {"detail": "Invalid API Key"}
+
+def test_valid_key_sets_request_state(client):
+    row = key_row(hash_api_key_secret("s3cret"))
+    with patch("brokerage_parser.core.middleware._fetch_api_key", return_value=row), \
+         patch("brokerage_parser.core.middleware._upgrade_api_key_hash") as upgrade:
+        response = client.get("/whoami", headers={"X-API-Key": "ak_abc_s3cret"})
+
+    assert response.status_code == 200
+    assert response.json() == {"tenant_id": str(TENANT_ID), "org_id": str(ORG_ID)}
+    upgrade.assert_not_called()
+
+def test_legacy_key_is_upgraded(client):
+    row = key_row(bcrypt.hashpw(b"s3cret", bcrypt.gensalt(rounds=4)).decode())
+    with patch("brokerage_parser.core.middleware._fetch_api_key", return_value=row), \
+         patch("brokerage_parser.core.middleware._upgrade_api_key_hash") as upgrade:
+        response = client.get("/whoami", headers={"X-API-Key": "ak_abc_s3cret"})
+
+    assert response.status_code == 200
+    upgrade.assert_called_once_with("abc", "s3cret")
+
+def test_import_without_settings(tmp_path):
+    """The middleware and rate limiter read settings per request, not at import."""
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    env = {"PATH": os.environ.get("PATH", ""), "PYTHONPATH": src, "PYTHONUTF8": "1"}
+    # tmp_path as cwd, so no .env file is picked up either
+    result = subprocess.run(
+        [sys.executable, "-c", "import brokerage_parser.core.middleware, brokerage_parser.core.rate_limiter"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=tmp_path,
+    )
+
+    assert result.returncode == 0, result.stderr